@@ -1,9 +1,11 @@
 import tkinter as tk
 import os
 import shutil
-import glob
+import errno
 import wave
 import logging
+import logging.handlers
+import atexit
 import traceback
 import xml.etree.ElementTree as ET
 from xml.sax.saxutils import escape as xml_escape, unescape as xml_unescape
@@ -11,11 +13,17 @@ import random
 import sys
 import subprocess
 import threading
+import functools
+import queue
+import concurrent.futures
+import multiprocessing
 from dataclasses import dataclass, field
 from tkinter import ttk, filedialog, messagebox
 from tkinter.ttk import Treeview
-from collections import defaultdict
+from collections import defaultdict, deque
+from itertools import groupby
 import struct
+import time
 import re
 import json
 import zipfile
@@ -28,9 +36,28 @@ try:
 except Exception:
     PIL_AVAILABLE = False
 
+# lxml is optional; its etree parses with libxml2 and has the same API
+try:
+    from lxml import etree as LET
+
+    LXML_AVAILABLE = True
+except ImportError:
+    LET = ET
+    LXML_AVAILABLE = False
+
+# orjson is optional; it decodes the ProgramPads JSON several times faster.
+# Its JSONDecodeError subclasses json.JSONDecodeError, so handlers still match.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
 # Attempt to import optional dependencies, handle if they are not present
 try:
-    from audio_pitch import detect_fundamental_pitch
+    from audio_pitch import detect_fundamental_pitch, detect_fundamental_pitch_batch
     from xpm_parameter_editor import (
         set_layer_keytrack,
         set_volume_adsr,
@@ -82,18 +109,69 @@ MPC_WHITE = "#FFFFFF"
 SCW_FRAME_THRESHOLD = 5000
 CREATIVE_FILTER_TYPE_MAP = {"LPF": "0", "HPF": "2", "BPF": "1"}
 EXPANSION_IMAGE_SIZE = (600, 600)  # default icon size
+LOG_FLUSH_INTERVAL_MS = 100  # how often queued log records reach the log view
+LOG_FLUSH_MAX_RECORDS = 500  # records inserted per flush
+LOG_MAX_LINES = 5000  # older lines are dropped from the log view
+FATAL_LOG_FILE = "fatal_error.log"
+FATAL_LOG_MAX_BYTES = 1_000_000
+FATAL_LOG_BACKUP_COUNT = 3
+_PREFIX_RE = re.compile(r"([A-Za-z0-9]+[_-])")  # Smart Split "prefix" mode
+_RENAMER_NOTE_RE = re.compile(r"([A-G][#b]?\-?\d+)", re.IGNORECASE)  # File Renamer
+_RENAMER_NUMBER_RE = re.compile(r"\b(\d{2,3})\b")  # File Renamer
+_WORD_SEPARATORS = str.maketrans("_-", "  ")  # Smart Split "word" mode
+_UNSAFE_NAME_CHARS = str.maketrans("", "", '\\/*?:"<>|')  # program file names
+CATEGORY_HEAD_CHARS = 8192  # start of a program Smart Split "category" mode reads
+ZIP_COMPRESS_LEVEL = 1  # deflate level for expansion ZIPs; favours speed
+# Audio and images barely shrink under deflate, so they are stored as-is
+_ZIP_STORED_EXTS = (
+    ".wav",
+    ".aif",
+    ".aiff",
+    ".flac",
+    ".mp3",
+    ".ogg",
+    ".png",
+    ".jpg",
+    ".jpeg",
+)
+FILE_COPY_BUFFER = 1 << 20  # chunk size for _fast_copy
+PREFETCH_AHEAD = 12  # files _prefetch_ahead hints to the kernel ahead of use
+# RIFF/WAVE header with a 16-byte PCM fmt chunk followed by the data chunk
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+_PAD_KEYS = tuple(f"value{i}" for i in range(128))  # ProgramPads "pads" keys
+# Bytes of XPM files whose parsed trees _load_xpm_tree keeps. A parsed tree
+# takes about six times its file's size, so this is roughly 100 MB of heap.
+XPM_TREE_CACHE_BYTES = 16 << 20
+SAMPLE_INFO_WORKERS = 8  # threads shared by all InstrumentBuilder.validate_batch
+SAMPLE_INFO_CACHE_SIZE = 8192  # analysed samples shared by all builders
+# A pad object ("valueN": {...}) with a non-empty samplePath
+_PADS_SAMPLE_PATH_RE = re.compile(r'"value\d+"\s*:\s*\{[^{}]*"samplePath"\s*:\s*"[^"]')
+_PAD_TO_INSTRUMENT_RE = re.compile(r'"padToInstrument"\s*:\s*\{([^{}]*)\}')
+_FIRST_SAMPLE_PATH_RE = re.compile(r'"samplePath"\s*:\s*("(?:[^"\\]|\\.)+")')
+_PROGRAM_PADS_TEXT_RE = re.compile(r"<(ProgramPads(?:-v[\w.]+)?)>([^<]*)</\1>")
+_FIRST_SAMPLE_NAME_RE = re.compile(r"<SampleName(?:\s*/>|>([^<]*)</SampleName>)")
+_LAYER_BODY_RE = re.compile(r"<Layer\b[^>]*(?<!/)>(.*?)</Layer>", re.DOTALL)
+_XML_TEXT_ENTITIES = {"&quot;": '"', "&apos;": "'"}  # besides &amp; &lt; &gt;
 
 
 # <editor-fold desc="Logging and Core Helpers">
 class TextHandler(logging.Handler):
-    """This handler sends logging records to a Tkinter Text widget."""
+    """This handler buffers logging records for a Tkinter Text widget.
+
+    ``emit`` may be called from worker threads, so it only queues the
+    formatted message. The Tk thread drains the queue periodically with
+    :meth:`flush_to_widget`, inserting many records in one widget update.
+    """
 
     def __init__(self, text_widget):
         logging.Handler.__init__(self)
         self.text_widget = text_widget
+        # The view keeps LOG_MAX_LINES lines, so anything older than that
+        # would be trimmed on insert anyway; drop it here instead.
+        self.pending = deque(maxlen=LOG_MAX_LINES)
 
     def emit(self, record):
-        """Safely write log messages to the associated Text widget."""
+        """Queue a formatted log message for the next widget flush."""
         try:
             msg = self.format(record)
         except Exception as exc:  # pragma: no cover - formatting errors are rare
@@ -103,23 +181,57 @@ class TextHandler(logging.Handler):
         if not msg:
             return
 
-        msg = str(msg)
+        self.pending.append(str(msg))
 
-        def append():
-            try:
-                if msg and self.text_widget and self.text_widget.winfo_exists():
-                    self.text_widget.configure(state="normal")
-                    self.text_widget.insert(tk.END, msg + "\n")
-                    self.text_widget.configure(state="disabled")
-                    self.text_widget.yview(tk.END)
-            except Exception as exc:
-                # Fallback to stderr if the Tk widget is unavailable
-                print(f"Text widget error: {exc}", file=sys.stderr)
+    def flush_to_widget(self, max_records=LOG_FLUSH_MAX_RECORDS):
+        """Write up to ``max_records`` queued messages. Call from the Tk thread."""
+        lines = []
+        while self.pending and len(lines) < max_records:
+            lines.append(self.pending.popleft())
+        if not lines:
+            return
 
-        if self.text_widget and self.text_widget.winfo_exists():
-            self.text_widget.after_idle(append)
-        else:
-            print(msg)
+        text = "\n".join(lines) + "\n"
+        try:
+            if self.text_widget and self.text_widget.winfo_exists():
+                self.text_widget.configure(state="normal")
+                self.text_widget.insert(tk.END, text)
+                line_count = int(self.text_widget.index("end-1c").split(".")[0])
+                if line_count > LOG_MAX_LINES:
+                    self.text_widget.delete(
+                        "1.0", f"{line_count - LOG_MAX_LINES}.0"
+                    )
+                self.text_widget.configure(state="disabled")
+                self.text_widget.yview(tk.END)
+            else:
+                print(text, end="")
+        except Exception as exc:
+            # Fallback to stderr if the Tk widget is unavailable
+            print(f"Text widget error: {exc}", file=sys.stderr)
+
+
+def _wait_for_tk(root, widget, func):
+    """Run ``func`` on the Tk thread and return its result to a worker.
+
+    ``func`` is skipped if ``widget`` has been destroyed by the time it is
+    scheduled, and the worker is released with None whenever ``func`` does
+    not return, so a closed window cannot stall the job queue.
+    """
+    done = threading.Event()
+    result = [None]
+
+    def call():
+        try:
+            if widget.winfo_exists():
+                result[0] = func()
+        except tk.TclError as e:
+            logging.warning(f"Dialog could not be shown: {e}")
+        finally:
+            done.set()
+
+    root.after_idle(call)
+    done.wait()
+    return result[0]
 
 
 def build_program_pads_json(
@@ -137,7 +249,7 @@ def build_program_pads_json(
     universal_pad = pad_cfg["universal_pad"]
     engine = pad_cfg.get("engine")
 
-    pads = {f"value{i}": 0 for i in range(128)}
+    pads = dict.fromkeys(_PAD_KEYS, 0)
     if mappings:
         for m in mappings:
             try:
@@ -145,9 +257,7 @@ def build_program_pads_json(
                 # Using the rootNote is a reasonable default.
                 pad_index = int(m.get("root_note", 0))
                 if 0 <= pad_index < 128:
-                    if not isinstance(pads[f"value{pad_index}"], dict):
-                        pads[f"value{pad_index}"] = {}
-                    pads[f"value{pad_index}"] = {
+                    pads[_PAD_KEYS[pad_index]] = {
                         "samplePath": m.get("sample_path", ""),
                         "rootNote": int(m.get("root_note", 60)),
                         "lowNote": int(m.get("low_note", 0)),
@@ -170,11 +280,129 @@ def build_program_pads_json(
         pads_obj["engine"] = engine
     if isinstance(num_instruments, int) and num_instruments > 0:
         pads_obj["padToInstrument"] = {str(i): i for i in range(num_instruments)}
-    json_str = json.dumps(pads_obj, indent=4)
-    return xml_escape(json_str)
+    return xml_escape(_json_dumps_compact(pads_obj))
+
 
+def _json_dumps_compact(obj):
+    """Return ``obj`` as compact JSON, as ``json.dumps`` would write it.
 
-def validate_xpm_file(xpm_path, expected_samples):
+    Compact separators are used because the JSON is embedded as XML text and
+    never read by eye. orjson is used when installed; its output is only
+    kept when it is pure ASCII, since orjson writes non-ASCII characters raw
+    where ``json.dumps`` escapes them.
+    """
+    if orjson is not None:
+        data = orjson.dumps(obj)
+        if data.isascii():
+            return data.decode("ascii")
+    return json.dumps(obj, separators=(",", ":"))
+
+
+_XPM_TREE_CACHE = {}  # path -> ((st_mtime_ns, st_size), ElementTree)
+_XPM_TREE_BYTES = 0  # sum of st_size over _XPM_TREE_CACHE
+_XPM_TREE_LOCK = threading.Lock()
+# (path, mtime_ns, size, analyze_scw) -> validate_sample_info result
+_SAMPLE_INFO_CACHE = {}
+_SAMPLE_INFO_LOCK = threading.Lock()
+# Analyses samples for InstrumentBuilder.validate_batch. Jobs never submit
+# to it themselves, so callers running in other pools can wait on it.
+_SAMPLE_INFO_POOL = concurrent.futures.ThreadPoolExecutor(
+    max_workers=SAMPLE_INFO_WORKERS, thread_name_prefix="sample-info"
+)
+# Uncaught exceptions; only this logger writes FATAL_LOG_FILE
+_FATAL_LOGGER = logging.getLogger("fatal")
+
+
+def _xpm_stat_key(path):
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def _remember_xpm_tree(path, key, tree):
+    global _XPM_TREE_BYTES
+    size = key[1]
+    with _XPM_TREE_LOCK:
+        old = _XPM_TREE_CACHE.pop(path, None)
+        if old is not None:
+            _XPM_TREE_BYTES -= old[0][1]
+        if size > XPM_TREE_CACHE_BYTES:
+            return
+        while _XPM_TREE_BYTES + size > XPM_TREE_CACHE_BYTES:
+            evicted_key, _tree = _XPM_TREE_CACHE.pop(next(iter(_XPM_TREE_CACHE)))
+            _XPM_TREE_BYTES -= evicted_key[1]
+        _XPM_TREE_CACHE[path] = (key, tree)
+        _XPM_TREE_BYTES += size
+
+
+def _load_xpm_tree(path):
+    """Return the parsed ``ElementTree`` for ``path``.
+
+    Trees are cached and reused while the file's mtime and size are
+    unchanged. The returned tree is shared, so code that modifies it must
+    save it with ``_write_xpm_tree`` or drop it with ``_forget_xpm_tree``.
+    """
+    key = _xpm_stat_key(path)
+    with _XPM_TREE_LOCK:
+        cached = _XPM_TREE_CACHE.get(path)
+    if cached is not None and cached[0] == key:
+        _remember_xpm_tree(path, key, cached[1])
+        return cached[1]
+    tree = ET.parse(path)
+    _remember_xpm_tree(path, key, tree)
+    return tree
+
+
+def _write_xpm_tree(tree, path):
+    """Write ``tree`` to ``path`` and keep it cached for the next reader."""
+    # Programs are small, so serialising to bytes first lets the file be
+    # written with one call instead of streaming through the writer.
+    data = ET.tostring(tree.getroot(), encoding="utf-8", xml_declaration=True)
+    with open(path, "wb") as f:
+        f.write(data)
+    _remember_xpm_tree(path, _xpm_stat_key(path), tree)
+
+
+def _xml_equal(a, b):
+    """Return whether two elements hold the same tags, attributes and text.
+
+    Whitespace around text is ignored, so an indented program equals its
+    compact copy.
+    """
+    if (
+        a.tag != b.tag
+        or a.attrib != b.attrib
+        or len(a) != len(b)
+        or (a.text or "").strip() != (b.text or "").strip()
+        or (a.tail or "").strip() != (b.tail or "").strip()
+    ):
+        return False
+    return all(map(_xml_equal, a, b))
+
+
+def _forget_xpm_tree(path):
+    """Drop the cached tree for ``path``.
+
+    Call this after writing ``path`` any other way than ``_write_xpm_tree``.
+    The stat key alone cannot be trusted to notice the edit: FAT keeps
+    mtimes to 2 s, and text edits such as "Poly" -> "Mono" keep the size.
+    """
+    global _XPM_TREE_BYTES
+    with _XPM_TREE_LOCK:
+        old = _XPM_TREE_CACHE.pop(path, None)
+        if old is not None:
+            _XPM_TREE_BYTES -= old[0][1]
+
+
+def _forget_xpm_trees_in(folder):
+    """Drop the cached trees of every program under ``folder``."""
+    prefix = os.path.join(folder, "")
+    with _XPM_TREE_LOCK:
+        paths = [path for path in _XPM_TREE_CACHE if path.startswith(prefix)]
+    for path in paths:
+        _forget_xpm_tree(path)
+
+
+def validate_xpm_file(xpm_path, expected_samples, tree=None):
     """
     Validate a generated XPM file. It checks for the modern ProgramPads section
     first. If that's not found, it falls back to checking for the legacy
@@ -182,11 +410,16 @@ def validate_xpm_file(xpm_path, expected_samples):
     can be validated correctly.
     
     Also verifies that KeygroupNumKeygroups matches the actual instrument count.
+
+    Pass ``tree`` to validate a program that is about to be written to
+    ``xpm_path`` without reading it back; fixes are then only made in memory
+    and the caller saves them when it writes the tree.
     """
     try:
-        with open(xpm_path, "r", encoding="utf-8") as f:
-            xml_text = f.read()
-        root = ET.fromstring(xml_text)
+        in_memory = tree is not None
+        if not in_memory:
+            tree = _load_xpm_tree(xpm_path)
+        root = tree.getroot()
         
         # Check if KeygroupNumKeygroups is consistent with actual instruments
         kg_count_elem = root.find(".//KeygroupNumKeygroups")
@@ -202,8 +435,8 @@ def validate_xpm_file(xpm_path, expected_samples):
                 )
                 # Fix the count
                 kg_count_elem.text = str(actual_kg_count)
-                tree = ET.ElementTree(root)
-                tree.write(xpm_path, encoding="utf-8", xml_declaration=True)
+                if not in_memory:
+                    _write_xpm_tree(tree, xpm_path)
                 logging.info(f"Fixed keygroup count in {os.path.basename(xpm_path)}.")
 
         # Check for modern ProgramPads section
@@ -211,22 +444,36 @@ def validate_xpm_file(xpm_path, expected_samples):
         if pads_elem is not None and pads_elem.text:
             # If it exists, validate its contents
             json_text = xml_unescape(pads_elem.text)
-            data = json.loads(json_text)
-            pads = data.get("pads", {})
-            entries = [
-                v for v in pads.values() if isinstance(v, dict) and v.get("samplePath")
-            ]
+            # Only "is any sample mapped" and the padToInstrument size are
+            # needed, so read them off the text and decode the JSON only
+            # when that is inconclusive.
+            has_entries = _PADS_SAMPLE_PATH_RE.search(json_text) is not None
+            pad_to_inst = _PAD_TO_INSTRUMENT_RE.search(json_text)
+            if (expected_samples > 0 and not has_entries) or (
+                pad_to_inst is None and '"padToInstrument"' in json_text
+            ):
+                data = _json_loads(json_text)
+                pads = data.get("pads", {})
+                has_entries = any(
+                    isinstance(v, dict) and v.get("samplePath") for v in pads.values()
+                )
+                pad_to_inst_count = (
+                    len(data["padToInstrument"]) if "padToInstrument" in data else None
+                )
+            elif pad_to_inst is not None:
+                pad_to_inst_count = pad_to_inst.group(1).count(":")
+            else:
+                pad_to_inst_count = None
             
             # Also check if padToInstrument mapping is correct
-            if 'padToInstrument' in data:
-                pad_to_inst = data['padToInstrument']
-                if len(pad_to_inst) != actual_kg_count:
+            if pad_to_inst_count is not None:
+                if pad_to_inst_count != actual_kg_count:
                     logging.warning(
                         f"padToInstrument mapping mismatch in {os.path.basename(xpm_path)}: "
-                        f"Found {len(pad_to_inst)} entries, but {actual_kg_count} instruments."
+                        f"Found {pad_to_inst_count} entries, but {actual_kg_count} instruments."
                     )
 
-            if expected_samples > 0 and len(entries) == 0:
+            if expected_samples > 0 and not has_entries:
                 logging.warning(
                     f"Validation failed for {os.path.basename(xpm_path)}: ProgramPads exists but has no sample entries."
                 )
@@ -270,6 +517,70 @@ def validate_xpm_file(xpm_path, expected_samples):
         return False
 
 
+def _split_ext(name):
+    """``os.path.splitext`` for a bare file name, without the path handling."""
+    head, dot, ext = name.rpartition(".")
+    if not dot or not head.strip("."):
+        return name, ""
+    return head, "." + ext
+
+
+def _find_preview_sample(xpm_path):
+    """Return the sample a preview of ``xpm_path`` should be copied from.
+
+    That is the first non-empty ``samplePath`` in ProgramPads, or else the
+    first layer's ``SampleName`` plus ``.wav``; None if neither is set. Only
+    those two values are needed, so they are searched for in the file text
+    instead of building the element tree. Files using character references
+    are streamed with ``iterparse`` instead, which stops as soon as both
+    values are known.
+    """
+    with open(xpm_path, encoding="utf-8", errors="replace") as f:
+        text = f.read()
+
+    if "&#" not in text:
+        pads = _PROGRAM_PADS_TEXT_RE.search(text)
+        if pads and pads.group(2):
+            # The JSON is escaped once before being stored as element text
+            json_text = xml_unescape(xml_unescape(pads.group(2), _XML_TEXT_ENTITIES))
+            # Pads are written in order, so the first non-empty samplePath is
+            # the one wanted; only that JSON string is decoded.
+            match = _FIRST_SAMPLE_PATH_RE.search(json_text)
+            if match:
+                return _json_loads(match.group(1))
+        # Like the Layer/SampleName lookup this replaced, only names inside
+        # a layer count, and the first layer that has one decides.
+        for layer in _LAYER_BODY_RE.finditer(text):
+            name = _FIRST_SAMPLE_NAME_RE.search(layer.group(1))
+            if name:
+                if not name.group(1):
+                    return None
+                return xml_unescape(name.group(1), _XML_TEXT_ENTITIES) + ".wav"
+        return None
+
+    pads_seen = False
+    first_name = None
+    with open(xpm_path, "rb") as f:
+        for _event, elem in ET.iterparse(f, events=("end",)):
+            if not pads_seen and elem.tag.startswith("ProgramPads"):
+                pads_seen = True
+                if elem.text:
+                    match = _FIRST_SAMPLE_PATH_RE.search(xml_unescape(elem.text))
+                    if match:
+                        return _json_loads(match.group(1))
+            elif elem.tag == "Layer":
+                if first_name is None:
+                    sample_elem = elem.find("SampleName")
+                    if sample_elem is not None:
+                        first_name = sample_elem.text or ""
+                elem.clear()
+            # Generated programs put ProgramPads before the instruments, so
+            # this usually stops at the first layer.
+            if pads_seen and first_name is not None:
+                break
+    return first_name + ".wav" if first_name else None
+
+
 def get_clean_sample_info(filepath):
     """Extracts basic info from a file path."""
     base = os.path.basename(filepath)
@@ -279,32 +590,39 @@ def get_clean_sample_info(filepath):
     return {"base": name, "ext": ext, "note": note, "folder": folder}
 
 
+_INSTRUMENT_TAGS = (
+    "piano",
+    "bell",
+    "pad",
+    "keys",
+    "guitar",
+    "bass",
+    "lead",
+    "pluck",
+    "drum",
+    "fx",
+    "vocal",
+    "ambient",
+    "brass",
+    "strings",
+    "woodwind",
+    "world",
+    "horn",
+)
+_INSTRUMENT_TAG_RANK = {tag: i for i, tag in enumerate(_INSTRUMENT_TAGS)}
+# The lookahead reports every occurrence, including overlapping ones, so the
+# earliest tag in _INSTRUMENT_TAGS wins regardless of where it appears.
+_INSTRUMENT_TAG_RE = re.compile(
+    "(?=(" + "|".join(map(re.escape, _INSTRUMENT_TAGS)) + "))", re.IGNORECASE
+)
+
+
 def get_instrument_category_from_text(text):
     """Returns a known instrument tag if it appears in the provided text."""
-    tags = [
-        "piano",
-        "bell",
-        "pad",
-        "keys",
-        "guitar",
-        "bass",
-        "lead",
-        "pluck",
-        "drum",
-        "fx",
-        "vocal",
-        "ambient",
-        "brass",
-        "strings",
-        "woodwind",
-        "world",
-        "horn",
-    ]
-    lower = text.lower()
-    for tag in tags:
-        if tag in lower:
-            return tag
-    return None
+    hits = _INSTRUMENT_TAG_RE.findall(text)
+    if not hits:
+        return None
+    return min((hit.lower() for hit in hits), key=_INSTRUMENT_TAG_RANK.__getitem__)
 
 
 def get_base_instrument_name(filepath, xpm_content=None):
@@ -314,54 +632,329 @@ def get_base_instrument_name(filepath, xpm_content=None):
         if category:
             return category
 
-    tags = [
-        "piano",
-        "bell",
-        "pad",
-        "keys",
-        "guitar",
-        "bass",
-        "lead",
-        "pluck",
-        "drum",
-        "fx",
-        "vocal",
-        "ambient",
-        "brass",
-        "strings",
-        "woodwind",
-        "world",
-        "horn",
-    ]
-    path = filepath.lower()
-    for tag in tags:
-        if tag in path:
-            return tag
+    category = get_instrument_category_from_text(filepath)
+    if category:
+        return category
     parent_folder = os.path.basename(os.path.dirname(filepath))
-    cleaned_folder = re.sub(r"[_-]", " ", parent_folder).strip()
+    cleaned_folder = parent_folder.translate(_WORD_SEPARATORS).strip()
     return cleaned_folder if cleaned_folder else "instrument"
 
 
+@functools.lru_cache(maxsize=8192)
+def _base_instrument_cached(filepath):
+    """Return ``get_base_instrument_name(filepath)``, memoized per path.
+
+    The result depends on the parent folder as well as the file name, so
+    the whole path is the key.
+    """
+    return get_base_instrument_name(filepath)
+
+
 def get_wav_frames(filepath):
     """Returns the number of frames in a WAV file."""
     try:
+        # Canonical 44-byte PCM headers are read directly; anything else
+        # goes through the wave module.
+        with open(filepath, "rb") as f:
+            header = f.read(_WAV_HEADER.size)
+        if len(header) == _WAV_HEADER.size:
+            fields = _WAV_HEADER.unpack(header)
+            riff, _, wave_id, fmt_id, fmt_size, fmt_tag, channels = fields[:7]
+            bits, data_id, data_size = fields[10:]
+            if (
+                riff == b"RIFF"
+                and wave_id == b"WAVE"
+                and fmt_id == b"fmt "
+                and fmt_size == 16
+                and fmt_tag == 1
+                and data_id == b"data"
+                and channels
+                and bits
+            ):
+                return data_size // (channels * ((bits + 7) // 8))
         with wave.open(filepath, "rb") as w:
             return w.getnframes()
     except Exception:
         return 0
 
 
+def _iter_file_entries(root, recursive=True, include_hidden=False):
+    """Yield an ``os.DirEntry`` for every file below ``root``.
+
+    Uses ``os.scandir`` so file types come from the directory entries
+    instead of an extra ``stat`` per file as with ``os.walk``. With
+    ``recursive`` False only the files directly in ``root`` are yielded. Like ``glob``, dot-files and dot-directories
+    (``.Trashes``, ``.Spotlight-V100``, ...) are skipped unless
+    ``include_hidden`` is True.
+    """
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if not include_hidden and entry.name.startswith("."):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            stack.append(entry.path)
+                    else:
+                        yield entry
+        except OSError as e:
+            logging.error(f"Could not scan {current}: {e}")
+
+
+def _iter_files(root):
+    """Yield ``(path, name)`` for every file below ``root``."""
+    for entry in _iter_file_entries(root):
+        yield entry.path, entry.name
+
+
+def _iter_ext(root, ext, recursive=True):
+    """Yield the path of every file below ``root`` ending in ``ext``.
+
+    ``ext`` is lowercase and matched case-insensitively. Hidden files,
+    including macOS resource forks (``._*``), and hidden folders are
+    skipped. ``recursive`` is passed on to ``_iter_file_entries``.
+    """
+    for entry in _iter_file_entries(root, recursive):
+        if entry.name.lower().endswith(ext):
+            yield entry.path
+
+
+def _iter_xpms(root):
+    """Yield the path of every ``.xpm`` program below ``root``.
+
+    Hidden files and folders, including macOS resource forks (``._*``) and
+    the Trash, are skipped.
+    """
+    yield from _iter_ext(root, ".xpm")
+
+
+def _prefetch_ahead(items, ahead=PREFETCH_AHEAD):
+    """Yield ``items`` (paths or ``os.DirEntry``) in order, reading ahead.
+
+    Each file is passed to ``posix_fadvise(POSIX_FADV_WILLNEED)`` ``ahead``
+    items before it is yielded, so the kernel is already fetching the next
+    files while the caller works through the current one. The hint only
+    queues readahead and returns, so no helper thread is needed. Where
+    ``posix_fadvise`` is missing the items are passed through unchanged.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        yield from items
+        return
+    pending = deque()
+    for item in items:
+        try:
+            fd = os.open(os.fspath(item), os.O_RDONLY)
+        except OSError:
+            pass
+        else:
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
+        pending.append(item)
+        if len(pending) > ahead:
+            yield pending.popleft()
+    yield from pending
+
+
+def _write_zip_entry(zipf, entry, arcname):
+    """Add the file behind ``entry`` to ``zipf`` as ``arcname``.
+
+    Types in ``_ZIP_STORED_EXTS`` are already compressed, so they are stored
+    as-is; everything else uses the archive's compression and level.
+    """
+    if entry.name.lower().endswith(_ZIP_STORED_EXTS):
+        zipf.write(entry.path, arcname, compress_type=zipfile.ZIP_STORED)
+    else:
+        zipf.write(entry.path, arcname)
+
+
+def _fast_copy(src, dst):
+    """Copy ``src`` to ``dst`` together with its metadata, like ``shutil.copy2``.
+
+    On Linux ``os.copy_file_range`` lets the kernel copy the data, or the
+    filesystem share it via reflinks. Elsewhere, or when the kernel refuses,
+    the data goes through a single ``FILE_COPY_BUFFER`` sized buffer.
+    """
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+    with open(src, "rb", buffering=0) as fsrc, open(dst, "wb", buffering=0) as fdst:
+        copied = 0
+        done = False
+        if hasattr(os, "copy_file_range"):
+            try:
+                while True:
+                    n = os.copy_file_range(
+                        fsrc.fileno(), fdst.fileno(), FILE_COPY_BUFFER
+                    )
+                    if not n:
+                        break
+                    copied += n
+                done = True
+            except OSError:
+                # Unsupported here (e.g. ENOSYS, EXDEV on older kernels);
+                # only safe to retry if nothing was written yet.
+                if copied:
+                    raise
+        if not done:
+            view = memoryview(bytearray(FILE_COPY_BUFFER))
+            while True:
+                n = fsrc.readinto(view)
+                if not n:
+                    break
+                fdst.write(view[:n])
+    shutil.copystat(src, dst)
+
+
+def _move_file(src, dst):
+    """Move ``src`` to ``dst`` with a single rename when on the same device.
+
+    Falls back to ``shutil.move`` only for cross-device moves.
+    """
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(src, dst)
+
+
+def _dir_names(path):
+    """Return the casefolded names of the entries in ``path``.
+
+    Batch moves take this listing once per destination folder and keep it
+    up to date themselves, instead of calling ``os.path.exists`` per file.
+    Names are casefolded on every platform: MPC cards (FAT/exFAT) and
+    macOS volumes are case-insensitive, so ``kick.wav`` must be seen as
+    clashing with ``Kick.wav`` or the move would overwrite it.
+    """
+    with os.scandir(path) as it:
+        return {entry.name.casefold() for entry in it}
+
+
+def _iter_xpm_elements(xpm_path):
+    """Yield each element of ``xpm_path`` as soon as its end tag is parsed.
+
+    Elements are cleared once the caller moves on, so memory stays bounded
+    by the element being read instead of the whole document.
+    """
+    for _event, elem in LET.iterparse(xpm_path, events=("end",)):
+        yield elem
+        elem.clear()
+
+
+def _path_key(path):
+    """Return ``path`` normalised for use as a lookup key."""
+    return os.path.normcase(os.path.normpath(path))
+
+
+@functools.lru_cache(maxsize=4096)
+def _sample_path_key(xpm_dir, sample_file):
+    """Return the ``_path_key`` of a ``SampleFile`` value in ``xpm_dir``."""
+    return _path_key(os.path.join(xpm_dir, sample_file.replace("/", os.sep)))
+
+
+def _xpm_references_any(xpm_path, sample_keys):
+    """Return True if ``xpm_path`` has a ``SampleFile`` in ``sample_keys``.
+
+    ``sample_keys`` holds ``_path_key`` values. The program is streamed and
+    the scan stops at the first match, so unaffected programs are never
+    built into a full tree.
+    """
+    xpm_dir = os.path.dirname(xpm_path)
+    for elem in _iter_xpm_elements(xpm_path):
+        if elem.tag == "SampleFile" and elem.text:
+            if _sample_path_key(xpm_dir, elem.text) in sample_keys:
+                return True
+    return False
+
+
+def _rewrite_renamed_samples(xpm_path, rename_map):
+    """Point the layers of ``xpm_path`` at renamed samples.
+
+    ``rename_map`` maps the ``_path_key`` of old sample paths to new paths.
+    Returns True if the program referenced any of them and was rewritten.
+    """
+    if not _xpm_references_any(xpm_path, rename_map):
+        return False
+    tree = LET.parse(xpm_path)
+    root = tree.getroot()
+    xpm_dir = os.path.dirname(xpm_path)
+    changed = False
+    # Each Layer holds its SampleFile and SampleName, so one walk over the
+    # layers updates both without searching for the parent of every
+    # renamed sample.
+    for layer in root.iter("Layer"):
+        elem = layer.find("SampleFile")
+        if elem is not None and elem.text:
+            new_sample_path = rename_map.get(_sample_path_key(xpm_dir, elem.text))
+            if new_sample_path is not None:
+                new_rel_path = os.path.relpath(new_sample_path, xpm_dir)
+                elem.text = new_rel_path.replace(os.sep, "/")
+
+                sample_name_elem = layer.find("SampleName")
+                if sample_name_elem is not None:
+                    sample_name_elem.text = os.path.splitext(
+                        os.path.basename(new_sample_path)
+                    )[0]
+                changed = True
+    if changed:
+        # Only element text changes, so the parsed whitespace still lays the
+        # file out and no indent pass is needed.
+        tree.write(xpm_path, encoding="utf-8", xml_declaration=True)
+        _forget_xpm_tree(xpm_path)
+    return changed
+
+
+def _rename_sample(original, new):
+    """Rename one sample file, logging rather than raising on failure."""
+    try:
+        if os.path.exists(original):
+            os.rename(original, new)
+        else:
+            logging.warning(f"Original file not found for renaming: {original}")
+    except Exception as e:
+        logging.error(f"Error renaming {original} to {new}: {e}")
+
+
 def parse_xpm_samples(xpm_path):
     """Return a list of sample paths referenced by an XPM."""
     samples = []
     try:
-        tree = ET.parse(xpm_path)
-        root = tree.getroot()
+        pads_texts = {}
+        names = []
+        files = []
+        for elem in _iter_xpm_elements(xpm_path):
+            tag = elem.tag
+            if tag == "SampleName":
+                if elem.text:
+                    names.append(elem.text + ".wav")
+            elif tag == "SampleFile":
+                if elem.text:
+                    files.append(elem.text)
+            elif isinstance(tag, str) and tag.startswith("ProgramPads"):
+                pads_texts.setdefault(tag, elem.text)
+
+        # Same precedence as find_program_pads
+        pads_text = None
+        for tag in ("ProgramPads-v2.10", "ProgramPads"):
+            if tag in pads_texts:
+                pads_text = pads_texts[tag]
+                break
+        else:
+            for tag, text in pads_texts.items():
+                if tag.startswith("ProgramPads-v"):
+                    pads_text = text
+                    break
 
-        pads_elem = find_program_pads(root)
-        if pads_elem is not None and pads_elem.text:
+        if pads_text:
             try:
-                data = json.loads(xml_unescape(pads_elem.text))
+                data = _json_loads(xml_unescape(pads_text))
             except json.JSONDecodeError as e:
                 logging.error(f"JSON decode error in {xpm_path}: {e}")
                 data = {}
@@ -370,13 +963,8 @@ def parse_xpm_samples(xpm_path):
                 if isinstance(pad, dict) and pad.get("samplePath"):
                     samples.append(pad["samplePath"])
 
-        for elem in root.findall(".//SampleName"):
-            if elem.text:
-                samples.append(elem.text + ".wav")
-
-        for elem in root.findall(".//SampleFile"):
-            if elem.text:
-                samples.append(elem.text)
+        samples.extend(names)
+        samples.extend(files)
     except Exception as e:
         logging.error(f"Could not parse samples from {xpm_path}: {e}")
     return samples
@@ -385,7 +973,7 @@ def parse_xpm_samples(xpm_path):
 def get_xpm_version(xpm_path):
     """Return Application_Version string from an XPM or 'Unknown'."""
     try:
-        tree = ET.parse(xpm_path)
+        tree = _load_xpm_tree(xpm_path)
         ver = tree.find(".//Application_Version")
         if ver is not None and ver.text:
             return ver.text
@@ -596,36 +1184,40 @@ class ExpansionDoctorWindow(tk.Toplevel):
         if not folder:
             return
 
+        # Lowercase name -> real name, so each reference is a dict lookup
+        # instead of a listdir and a linear scan
+        folder_map = {}
+        for f in os.listdir(folder):
+            folder_map.setdefault(f.lower(), f)  # first match wins, as before
+
         fixed_count = 0
         for xpm_path, missing_list in self.broken_links.items():
             try:
-                tree = ET.parse(xpm_path)
-                root = tree.getroot()
+                # Samples are copied next to the program under the name it
+                # already references, so the XPM itself is only read.
+                root = _load_xpm_tree(xpm_path).getroot()
                 changed = False
 
                 samples_to_find = set(missing_list)
 
-                for elem in root.findall(".//SampleFile"):
+                for elem in root.iter("SampleFile"):
                     if elem is not None and elem.text:
                         sample_basename = os.path.basename(
                             elem.text.replace("/", os.sep)
                         )
                         if sample_basename in samples_to_find:
-                            for f in os.listdir(folder):
-                                if f.lower() == sample_basename.lower():
-                                    dest_path = os.path.join(
-                                        os.path.dirname(xpm_path), sample_basename
-                                    )
-                                    shutil.copy2(os.path.join(folder, f), dest_path)
-                                    logging.info(
-                                        f"Relinked '{sample_basename}' to '{dest_path}' for {xpm_path}"
-                                    )
-                                    changed = True
-                                    samples_to_find.remove(sample_basename)
-                                    break
+                            real_name = folder_map.get(sample_basename.lower())
+                            if real_name is not None:
+                                dest_path = os.path.join(
+                                    os.path.dirname(xpm_path), sample_basename
+                                )
+                                _fast_copy(os.path.join(folder, real_name), dest_path)
+                                logging.info(
+                                    f"Relinked '{sample_basename}' to '{dest_path}' for {xpm_path}"
+                                )
+                                changed = True
+                                samples_to_find.remove(sample_basename)
                 if changed:
-                    indent_tree(tree)
-                    tree.write(xpm_path, encoding="utf-8", xml_declaration=True)
                     fixed_count += 1
             except Exception as e:
                 logging.error(f"Error relinking samples for {xpm_path}: {e}")
@@ -642,7 +1234,7 @@ class ExpansionDoctorWindow(tk.Toplevel):
         target_fmt = self.format_var.get()
 
         params = {"rename": False, "version": target_fw, "format_version": target_fmt}
-        updated = batch_edit_programs(folder, params)
+        updated = batch_edit_programs(folder, params, self.master._list_xpms(folder))
 
         self.status.set(
             f"Updated {updated} XPM(s) to version {target_fw} ({target_fmt}). Rescanning..."
@@ -659,7 +1251,7 @@ class ExpansionDoctorWindow(tk.Toplevel):
         fmt = self.format_var.get()
         fixed = 0
 
-        for path in glob.glob(os.path.join(folder, "**", "*.xpm"), recursive=True):
+        for path in list(_iter_xpms(folder)):
             try:
                 mappings, inst_params = _parse_xpm_for_rebuild(path)
                 if not mappings:
@@ -771,13 +1363,24 @@ class ExpansionDoctorWindow(tk.Toplevel):
             self.status.set("No folder selected.")
             return
 
-        xpms = glob.glob(os.path.join(folder, "**", "*.xpm"), recursive=True)
+        xpms = list(_iter_xpms(folder))
         total = len(xpms)
+        # dir -> names in it; one listdir per sample folder instead of a
+        # stat per referenced sample
+        dir_listings = {}
 
         for xpm_path in xpms:
+            # Stream the program once for its sample references and version
+            # instead of building the whole tree.
+            sample_files = []
+            version = None
             try:
-                tree = ET.parse(xpm_path)
-                root = tree.getroot()
+                for elem in _iter_xpm_elements(xpm_path):
+                    if elem.tag == "SampleFile":
+                        if elem.text:
+                            sample_files.append(elem.text)
+                    elif elem.tag == "Application_Version" and version is None:
+                        version = elem.text
             except Exception as e:
                 rel = os.path.relpath(xpm_path, folder)
                 logging.error(f"Error scanning {xpm_path}: {e}")
@@ -794,17 +1397,26 @@ class ExpansionDoctorWindow(tk.Toplevel):
                 continue
 
             missing = set()
-            for elem in root.findall(".//SampleFile"):
-                if elem is not None and elem.text:
-                    normalized_rel_path = elem.text.replace("/", os.sep)
-                    sample_abs_path = os.path.normpath(
-                        os.path.join(os.path.dirname(xpm_path), normalized_rel_path)
-                    )
-                    if not os.path.exists(sample_abs_path):
-                        missing.add(os.path.basename(elem.text))
+            for sample_file in sample_files:
+                normalized_rel_path = sample_file.replace("/", os.sep)
+                sample_abs_path = os.path.normpath(
+                    os.path.join(os.path.dirname(xpm_path), normalized_rel_path)
+                )
+                sample_dir, sample_name = os.path.split(sample_abs_path)
+                names = dir_listings.get(sample_dir)
+                if names is None:
+                    try:
+                        names = set(os.listdir(sample_dir))
+                    except OSError:
+                        names = set()
+                    dir_listings[sample_dir] = names
+                # Fall back to a real check for names the listing does not
+                # contain, e.g. a different case on case-insensitive volumes
+                if sample_name not in names and not os.path.exists(sample_abs_path):
+                    missing.add(os.path.basename(sample_file))
 
             missing_list = sorted(list(missing))
-            version = get_xpm_version(xpm_path)
+            version = version or "Unknown"
             valid = is_valid_xpm(xpm_path)
             self.tree.insert(
                 "",
@@ -966,7 +1578,7 @@ class ExpansionBuilderWindow(tk.Toplevel):
                     img = img.resize(EXPANSION_IMAGE_SIZE, Image.LANCZOS)
                     img.save(dest_path)
                 else:
-                    shutil.copy2(image_path, dest_path)
+                    _fast_copy(image_path, dest_path)
             except Exception as e:
                 logging.error(f"Failed to copy image: {e}")
                 messagebox.showerror(
@@ -997,7 +1609,9 @@ class FileRenamerWindow(tk.Toplevel):
         self.folder_path = master.folder_path.get()
         self.include_folder_var = tk.BooleanVar(value=True)
         self.rename_proposals = []
-        self.check_vars = {}
+        # Row ids ticked in the "Select" column. Kept in Python so batch
+        # edits do not read a Tcl variable per row.
+        self.checked_rows = set()
         self.create_widgets()
         self.scan_files()
 
@@ -1037,13 +1651,19 @@ class FileRenamerWindow(tk.Toplevel):
             side="left"
         )
         ttk.Button(
-            batch_frame, text="Title Case", command=lambda: self.batch_case("title")
+            batch_frame,
+            text="Title Case",
+            command=functools.partial(self.batch_case, "title"),
         ).pack(side="left", padx=(10, 2))
         ttk.Button(
-            batch_frame, text="UPPERCASE", command=lambda: self.batch_case("upper")
+            batch_frame,
+            text="UPPERCASE",
+            command=functools.partial(self.batch_case, "upper"),
         ).pack(side="left", padx=2)
         ttk.Button(
-            batch_frame, text="lowercase", command=lambda: self.batch_case("lower")
+            batch_frame,
+            text="lowercase",
+            command=functools.partial(self.batch_case, "lower"),
         ).pack(side="left", padx=2)
 
         tree_frame = ttk.Frame(main_frame)
@@ -1071,12 +1691,12 @@ class FileRenamerWindow(tk.Toplevel):
         ttk.Button(
             bottom_frame,
             text="Select All",
-            command=lambda: self.toggle_all_checks(True),
+            command=functools.partial(self.toggle_all_checks, True),
         ).pack(side="left")
         ttk.Button(
             bottom_frame,
             text="Deselect All",
-            command=lambda: self.toggle_all_checks(False),
+            command=functools.partial(self.toggle_all_checks, False),
         ).pack(side="left", padx=5)
         self.apply_button = ttk.Button(
             bottom_frame,
@@ -1093,10 +1713,8 @@ class FileRenamerWindow(tk.Toplevel):
         if self.include_folder_var.get():
             parts.append(info["folder"].strip())
 
-        base_name_cleaned = re.sub(
-            r"([A-G][#b]?\-?\d+)", "", info["base"], flags=re.IGNORECASE
-        ).strip()
-        base_name_cleaned = re.sub(r"\b(\d{2,3})\b", "", base_name_cleaned).strip()
+        base_name_cleaned = _RENAMER_NOTE_RE.sub("", info["base"]).strip()
+        base_name_cleaned = _RENAMER_NUMBER_RE.sub("", base_name_cleaned).strip()
         parts.append(base_name_cleaned)
 
         if note_str:
@@ -1106,17 +1724,14 @@ class FileRenamerWindow(tk.Toplevel):
         return f"{final_base}{info['ext']}"
 
     def update_all_suggestions(self):
-        for i, row_id in enumerate(self.tree.get_children()):
-            proposal = self.rename_proposals[i]
-            new_name = self._generate_suggestion(proposal)
-            proposal["new_name"] = new_name
-            self.tree.set(row_id, "Suggested", new_name)
+        for proposal, row_id in zip(self.rename_proposals, self.tree.get_children()):
+            self._set_suggestion(proposal, row_id, self._generate_suggestion(proposal))
 
     def scan_files(self):
         for i in self.tree.get_children():
             self.tree.delete(i)
         self.rename_proposals.clear()
-        self.check_vars.clear()
+        self.checked_rows.clear()
 
         if not self.folder_path or not os.path.isdir(self.folder_path):
             messagebox.showwarning(
@@ -1124,10 +1739,7 @@ class FileRenamerWindow(tk.Toplevel):
             )
             return
 
-        wav_files = glob.glob(
-            os.path.join(self.folder_path, "**", "*.wav"), recursive=True
-        )
-        for path in wav_files:
+        for path in _iter_ext(self.folder_path, ".wav"):
             if ".xpm.wav" in path.lower():
                 continue
 
@@ -1144,13 +1756,12 @@ class FileRenamerWindow(tk.Toplevel):
             proposal["new_name"] = self._generate_suggestion(proposal)
             self.rename_proposals.append(proposal)
 
-        for i, proposal in enumerate(self.rename_proposals):
-            row_id = self.tree.insert(
+        for proposal in self.rename_proposals:
+            self.tree.insert(
                 "",
                 "end",
                 values=("No", proposal["original_name"], proposal["new_name"]),
             )
-            self.check_vars[row_id] = tk.BooleanVar(value=False)
 
         self.apply_button.config(
             state="normal" if self.rename_proposals else "disabled"
@@ -1166,45 +1777,63 @@ class FileRenamerWindow(tk.Toplevel):
             return
 
         if col == "#1":
-            current_val = self.check_vars[row_id].get()
-            self.check_vars[row_id].set(not current_val)
-            self.tree.set(row_id, "Select", "Yes" if not current_val else "No")
+            if row_id in self.checked_rows:
+                self.checked_rows.discard(row_id)
+                self.tree.set(row_id, "Select", "No")
+            else:
+                self.checked_rows.add(row_id)
+                self.tree.set(row_id, "Select", "Yes")
+
+    def _checked_rows(self):
+        """Yield ``(proposal, row_id)`` for every checked row."""
+        if not self.checked_rows:
+            return
+        for proposal, row_id in zip(self.rename_proposals, self.tree.get_children()):
+            if row_id in self.checked_rows:
+                yield proposal, row_id
+
+    def _set_suggestion(self, proposal, row_id, new_name):
+        """Store ``new_name`` on the proposal and show it if it changed.
+
+        The proposals hold the suggested names, so batch edits never read
+        them back from the tree and only touch rows that actually change.
+        """
+        if new_name != proposal["new_name"]:
+            proposal["new_name"] = new_name
+            self.tree.set(row_id, "Suggested", new_name)
 
     def batch_remove_chars(self):
         chars = self.remove_chars_entry.get()
         if not chars:
             return
-        for row_id in self.tree.get_children():
-            if self.check_vars.get(row_id, tk.BooleanVar(value=False)).get():
-                current_name = self.tree.set(row_id, "Suggested")
-                new_name = current_name.translate({ord(c): None for c in chars})
-                self.tree.set(row_id, "Suggested", new_name)
+        table = str.maketrans("", "", chars)
+        for proposal, row_id in self._checked_rows():
+            self._set_suggestion(
+                proposal, row_id, proposal["new_name"].translate(table)
+            )
 
     def batch_replace(self):
         old = self.replace_from_entry.get()
         new = self.replace_to_entry.get()
         if not old:
             return
-        for row_id in self.tree.get_children():
-            if self.check_vars.get(row_id, tk.BooleanVar(value=False)).get():
-                current_name = self.tree.set(row_id, "Suggested")
-                new_name = current_name.replace(old, new)
-                self.tree.set(row_id, "Suggested", new_name)
+        for proposal, row_id in self._checked_rows():
+            self._set_suggestion(
+                proposal, row_id, proposal["new_name"].replace(old, new)
+            )
 
     def batch_case(self, mode):
-        for row_id in self.tree.get_children():
-            if self.check_vars.get(row_id, tk.BooleanVar(value=False)).get():
-                current_name = self.tree.set(row_id, "Suggested")
-                name_part, ext_part = os.path.splitext(current_name)
-                if mode == "upper":
-                    new_name_part = name_part.upper()
-                elif mode == "lower":
-                    new_name_part = name_part.lower()
-                elif mode == "title":
-                    new_name_part = name_part.title()
-                else:
-                    continue
-                self.tree.set(row_id, "Suggested", new_name_part + ext_part)
+        if mode == "upper":
+            convert = str.upper
+        elif mode == "lower":
+            convert = str.lower
+        elif mode == "title":
+            convert = str.title
+        else:
+            return
+        for proposal, row_id in self._checked_rows():
+            name_part, ext_part = _split_ext(proposal["new_name"])
+            self._set_suggestion(proposal, row_id, convert(name_part) + ext_part)
 
     def on_edit_cell(self, event):
         region = self.tree.identify("region", event.x, event.y)
@@ -1223,19 +1852,15 @@ class FileRenamerWindow(tk.Toplevel):
             entry.focus()
 
             def save_edit(event=None):
-                self.tree.set(row_id, "Suggested", entry.get())
+                proposal = self.rename_proposals[self.tree.index(row_id)]
+                self._set_suggestion(proposal, row_id, entry.get())
                 entry.destroy()
 
             entry.bind("<Return>", save_edit)
             entry.bind("<FocusOut>", save_edit)
 
     def apply_renames(self):
-        selected_proposals = []
-        for i, row_id in enumerate(self.tree.get_children()):
-            if self.check_vars.get(row_id, tk.BooleanVar(value=False)).get():
-                proposal = self.rename_proposals[i]
-                proposal["new_name"] = self.tree.set(row_id, "Suggested")
-                selected_proposals.append(proposal)
+        selected_proposals = [proposal for proposal, _ in self._checked_rows()]
 
         if not selected_proposals:
             messagebox.showinfo(
@@ -1257,52 +1882,32 @@ class FileRenamerWindow(tk.Toplevel):
             for item in selected_proposals
         }
 
-        all_xpms = glob.glob(
-            os.path.join(self.folder_path, "**", "*.xpm"), recursive=True
-        )
-
-        for xpm_path in all_xpms:
-            try:
-                tree = ET.parse(xpm_path)
-                root = tree.getroot()
-                changed = False
-                for elem in root.findall(".//SampleFile"):
-                    if elem is not None and elem.text:
-                        rel_path = elem.text.replace("/", os.sep)
-                        original_sample_path = os.path.normpath(
-                            os.path.join(os.path.dirname(xpm_path), rel_path)
-                        )
-                        if original_sample_path in rename_map:
-                            new_sample_path = rename_map[original_sample_path]
-                            new_rel_path = os.path.relpath(
-                                new_sample_path, os.path.dirname(xpm_path)
-                            )
-                            elem.text = new_rel_path.replace(os.sep, "/")
-
-                            parent_layer = root.find(
-                                f".//Layer[SampleFile='{elem.text}']"
-                            )
-                            if parent_layer is not None:
-                                sample_name_elem = parent_layer.find("SampleName")
-                                if sample_name_elem is not None:
-                                    sample_name_elem.text = os.path.splitext(
-                                        os.path.basename(new_sample_path)
-                                    )[0]
-                            changed = True
-                if changed:
-                    indent_tree(tree)
-                    tree.write(xpm_path, encoding="utf-8", xml_declaration=True)
-            except Exception as e:
-                logging.error(f"Error updating XPM {xpm_path}: {e}")
+        sample_renames = {_path_key(old): new for old, new in rename_map.items()}
+
+        # Each program is read and rewritten on its own, so the programs are
+        # processed in parallel as the walk finds them. Samples are only
+        # renamed once all are done.
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            futures = {
+                executor.submit(
+                    _rewrite_renamed_samples, xpm_path, sample_renames
+                ): xpm_path
+                for xpm_path in _iter_xpms(self.folder_path)
+            }
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    logging.error(f"Error updating XPM {futures[future]}: {e}")
 
-        for original, new in rename_map.items():
-            try:
-                if os.path.exists(original):
-                    os.rename(original, new)
-                else:
-                    logging.warning(f"Original file not found for renaming: {original}")
-            except Exception as e:
-                logging.error(f"Error renaming {original} to {new}: {e}")
+        # Renames only overlap when one file takes another's old name; those
+        # must run in order, anything else can be issued concurrently.
+        if rename_map.keys().isdisjoint(rename_map.values()):
+            with concurrent.futures.ThreadPoolExecutor() as executor:
+                list(executor.map(_rename_sample, rename_map, rename_map.values()))
+        else:
+            for original, new in rename_map.items():
+                _rename_sample(original, new)
 
         messagebox.showinfo(
             "Success", "Files renamed and programs updated.", parent=self
@@ -1310,9 +1915,16 @@ class FileRenamerWindow(tk.Toplevel):
         self.scan_files()
 
     def toggle_all_checks(self, select_all):
-        for row_id in self.tree.get_children():
-            self.check_vars[row_id].set(select_all)
-            self.tree.set(row_id, "Select", "Yes" if select_all else "No")
+        label = "Yes" if select_all else "No"
+        children = self.tree.get_children()
+        for row_id in children:
+            # Only rows whose state flips need their cell redrawn
+            if (row_id in self.checked_rows) != select_all:
+                self.tree.set(row_id, "Select", label)
+        if select_all:
+            self.checked_rows.update(children)
+        else:
+            self.checked_rows.clear()
 
 
 class CreativeModeConfigWindow(tk.Toplevel):
@@ -1417,11 +2029,18 @@ class SCWToolWindow(tk.Toplevel):
 
     def scan_for_scw(self):
         folder = self.master.folder_path.get()
-        wav_files = glob.glob(os.path.join(folder, "**", "*.wav"), recursive=True)
-        for wav_path in wav_files:
-            if get_wav_frames(wav_path) < SCW_FRAME_THRESHOLD:
+        wav_files = list(_iter_ext(folder, ".wav"))
+        # Each check only reads a WAV header, so the reads are overlapped in
+        # a thread pool; map() keeps the results in file order.
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            frame_counts = list(executor.map(get_wav_frames, wav_files))
+        for wav_path, frames in zip(wav_files, frame_counts):
+            if frames < SCW_FRAME_THRESHOLD:
                 self.scw_files.append(wav_path)
-                self.listbox.insert(tk.END, os.path.relpath(wav_path, folder))
+        if self.scw_files:
+            self.listbox.insert(
+                tk.END, *(os.path.relpath(path, folder) for path in self.scw_files)
+            )
 
     def create_instruments(self):
         selected_indices = self.listbox.curselection()
@@ -1604,12 +2223,9 @@ class BatchTransposeWindow(tk.Toplevel):
         self.xpm_files = []
 
         try:
-            if self.recursive_search.get():
-                pattern = os.path.join(folder, "**", "*.xpm")
-                files = glob.glob(pattern, recursive=True)
-            else:
-                pattern = os.path.join(folder, "*.xpm")
-                files = glob.glob(pattern)
+            files = list(
+                _iter_ext(folder, ".xpm", recursive=self.recursive_search.get())
+            )
 
             self.xpm_files = files
             self.update_file_list()
@@ -1626,7 +2242,7 @@ class BatchTransposeWindow(tk.Toplevel):
     def get_current_transpose(self, xpm_path):
         """Get current transpose value from XPM file."""
         try:
-            tree = ET.parse(xpm_path)
+            tree = _load_xpm_tree(xpm_path)
             root = tree.getroot()
             transpose_elem = root.find(".//KeygroupMasterTranspose")
             if transpose_elem is not None and transpose_elem.text:
@@ -1639,7 +2255,7 @@ class BatchTransposeWindow(tk.Toplevel):
     def analyze_xpm_pitch_issues(self, xpm_path):
         """Intelligently analyze XPM file to detect optimal transpose for C0-C8 playability."""
         try:
-            tree = ET.parse(xpm_path)
+            tree = _load_xpm_tree(xpm_path)
             root = tree.getroot()
             
             # Get current master transpose
@@ -1949,6 +2565,7 @@ class BatchTransposeWindow(tk.Toplevel):
                 
                 # Save file
                 tree.write(xpm_path, encoding="utf-8", xml_declaration=True)
+                _forget_xpm_tree(xpm_path)
                 successful += 1
                 
             except Exception as e:
@@ -2591,12 +3208,12 @@ class BatchProgramFixerWindow(tk.Toplevel):
         ttk.Button(
             actions_frame,
             text="Select All",
-            command=lambda: self.toggle_all_checks(True),
+            command=functools.partial(self.toggle_all_checks, True),
         ).pack(side="left", padx=5)
         ttk.Button(
             actions_frame,
             text="Deselect All",
-            command=lambda: self.toggle_all_checks(False),
+            command=functools.partial(self.toggle_all_checks, False),
         ).pack(side="left", padx=5)
         ttk.Button(
             actions_frame,
@@ -2632,34 +3249,25 @@ class BatchProgramFixerWindow(tk.Toplevel):
 
     def _ask_yesno_safe(self, title, message):
         """Safely ask a yes/no question from a background thread."""
-        result = threading.Event()
-        answer = tk.BooleanVar()
-
-        def ask():
-            answer.set(messagebox.askyesno(title, message, parent=self))
-            result.set()
-
-        self.master.root.after_idle(ask)
-        result.wait()
-        return answer.get()
+        answer = _wait_for_tk(
+            self.master.root,
+            self,
+            lambda: messagebox.askyesno(title, message, parent=self),
+        )
+        return bool(answer)
 
     def _ask_directory_safe(self, title):
         """Safely ask for a directory from a background thread."""
-        result = threading.Event()
-        path = tk.StringVar()
 
         def ask():
             res = filedialog.askdirectory(
                 parent=self, title=title, initialdir=self.master.last_browse_path
             )
             if res:
-                path.set(res)
                 self.master.last_browse_path = res
-            result.set()
+            return res
 
-        self.master.root.after_idle(ask)
-        result.wait()
-        return path.get()
+        return _wait_for_tk(self.master.root, self, ask) or ""
 
     # NEW: Thread-safe way to open the sample selector and get the result
     def _open_sample_selector_safe(self, xpm_path, initial_mappings, extras):
@@ -2677,18 +3285,12 @@ class BatchProgramFixerWindow(tk.Toplevel):
             return dialog.result
 
         # Otherwise we're in a worker thread and must coordinate with Tk
-        result_container = {}
-        done_event = threading.Event()
-
         def open_dialog():
             dialog = SampleSelectorWindow(self, xpm_path, initial_mappings, extras)
             self.wait_window(dialog)
-            result_container["result"] = dialog.result
-            done_event.set()
+            return dialog.result
 
-        self.master.root.after_idle(open_dialog)
-        done_event.wait()
-        return result_container.get("result")
+        return _wait_for_tk(self.master.root, self, open_dialog)
 
     def browse_folder(self):
         path = filedialog.askdirectory(
@@ -2714,8 +3316,7 @@ class BatchProgramFixerWindow(tk.Toplevel):
         self.check_vars.clear()
         self.xpm_map.clear()
 
-        xpm_files = glob.glob(os.path.join(folder, "**", "*.xpm"), recursive=True)
-        for path in xpm_files:
+        for path in _iter_xpms(folder):
             version = get_xpm_version(path)
             rel_path = os.path.relpath(path, folder)
             item_id = self.tree.insert(
@@ -2760,9 +3361,7 @@ class BatchProgramFixerWindow(tk.Toplevel):
                 parent=self,
             )
             return
-        threading.Thread(
-            target=self.analyze_and_relink_batch, args=(selected_ids,), daemon=True
-        ).start()
+        self.master.submit_job(self.analyze_and_relink_batch, selected_ids)
         
     def fix_keygroup_counts(self):
         """Fix keygroup counts in all XPM files in the selected folder."""
@@ -2779,12 +3378,13 @@ class BatchProgramFixerWindow(tk.Toplevel):
         ):
             return
             
-        # Run the fix operation in a separate thread
+        # Run the fix operation on the app's background worker
         def run_fix():
             from batch_program_editor import fix_keygroup_counts
             try:
                 self.update_status("Fixing keygroup counts...")
                 fixed = fix_keygroup_counts(folder)
+                _forget_xpm_trees_in(folder)
                 self.master.root.after_idle(
                     lambda: messagebox.showinfo(
                         "Fix Complete", 
@@ -2805,7 +3405,7 @@ class BatchProgramFixerWindow(tk.Toplevel):
             finally:
                 self.update_status("Ready")
                 
-        threading.Thread(target=run_fix, daemon=True).start()
+        self.master.submit_job(run_fix)
 
     def run_rebuild_thread(self):
         selected_ids = self.get_selected_items()
@@ -2816,9 +3416,7 @@ class BatchProgramFixerWindow(tk.Toplevel):
                 parent=self,
             )
             return
-        threading.Thread(
-            target=self.rebuild_batch, args=(selected_ids,), daemon=True
-        ).start()
+        self.master.submit_job(self.rebuild_batch, selected_ids)
 
     def open_sample_editor(self):
         selected_ids = self.get_selected_items()
@@ -2903,7 +3501,7 @@ class BatchProgramFixerWindow(tk.Toplevel):
                 xpm_dir = os.path.dirname(xpm_path)
 
                 found_missing_for_this_file = False
-                for elem in root.findall(".//SampleFile"):
+                for elem in root.iter("SampleFile"):
                     if elem is not None and elem.text:
                         sample_rel_path = elem.text.replace("/", os.sep)
                         sample_abs_path = os.path.normpath(
@@ -2952,7 +3550,7 @@ class BatchProgramFixerWindow(tk.Toplevel):
                 changed = False
                 xpm_dir = os.path.dirname(xpm_path)
 
-                for elem in root.findall(".//SampleFile"):
+                for elem in root.iter("SampleFile"):
                     sample_basename = os.path.basename(elem.text.replace("/", os.sep))
                     if sample_basename in missing_list:
                         found_path = os.path.join(sample_folder, sample_basename)
@@ -2969,6 +3567,7 @@ class BatchProgramFixerWindow(tk.Toplevel):
                     shutil.copy2(xpm_path, xpm_path + ".bak")
                     indent_tree(tree)
                     tree.write(xpm_path, encoding="utf-8", xml_declaration=True)
+                    _forget_xpm_tree(xpm_path)
                     self.tree.set(self.get_id_from_path(xpm_path), "Status", "Relinked")
             except Exception as e:
                 self.tree.set(self.get_id_from_path(xpm_path), "Status", "Relink Error")
@@ -3085,6 +3684,8 @@ class InstrumentBuilder:
         self.folder_path = folder_path
         self.app = app
         self.options = options
+        self._program_params_cache = {}
+        self._instrument_params_cache = {}
 
     # <editor-fold desc="GUI Safe Callbacks">
     def _show_info_safe(self, title, message):
@@ -3103,16 +3704,12 @@ class InstrumentBuilder:
         )
 
     def _ask_yesno_safe(self, title, message):
-        result = threading.Event()
-        answer = tk.BooleanVar()
-
-        def ask():
-            answer.set(messagebox.askyesno(title, message, parent=self.app.root))
-            result.set()
-
-        self.app.root.after_idle(ask)
-        result.wait()
-        return answer.get()
+        answer = _wait_for_tk(
+            self.app.root,
+            self.app.root,
+            lambda: messagebox.askyesno(title, message, parent=self.app.root),
+        )
+        return bool(answer)
 
     # </editor-fold>
 
@@ -3184,7 +3781,7 @@ class InstrumentBuilder:
                     self.app.status_text.set(f"Creating: {program_name}")
                     self.app.progress["value"] = i + 1
 
-                    sanitized_name = re.sub(r'[\\/*?:"<>|]', "", program_name)
+                    sanitized_name = program_name.translate(_UNSAFE_NAME_CHARS)
                     first_file_abs_path = os.path.join(self.folder_path, group_files[0])
                     output_folder = os.path.dirname(first_file_abs_path)
 
@@ -3270,9 +3867,10 @@ class InstrumentBuilder:
             start_note = 60
             if mappings:
                 # This path is for rebuilding from existing mappings
-                for m in mappings:
-                    abs_path = m["sample_path"]
-                    info = self.validate_sample_info(abs_path)
+                abs_paths = [m["sample_path"] for m in mappings]
+                for m, abs_path, info in zip(
+                    mappings, abs_paths, self.validate_batch(abs_paths)
+                ):
                     if not info.get("is_valid"):
                         continue
                     # Preserve all parameters from the mapping
@@ -3282,13 +3880,18 @@ class InstrumentBuilder:
                     sample_infos.append(info)
             else:
                 # This path is for building a NEW instrument from files
-                for idx, file_path in enumerate(sample_files):
-                    abs_path = (
+                abs_paths = [
+                    (
                         os.path.join(self.folder_path, file_path)
                         if not os.path.isabs(file_path)
                         else file_path
                     )
-                    info = self.validate_sample_info(abs_path)
+                    for file_path in sample_files
+                ]
+                infos = self.validate_batch(abs_paths)
+                for idx, (file_path, abs_path, info) in enumerate(
+                    zip(sample_files, abs_paths, infos)
+                ):
                     if info.get("is_valid"):
                         if midi_notes and idx < len(midi_notes):
                             midi_note = midi_notes[idx]
@@ -3323,15 +3926,24 @@ class InstrumentBuilder:
                 logging.warning(f"No valid samples for program: {program_name}")
                 return False
 
-            # Group samples by their key range to create keygroups
-            note_layers = defaultdict(list)
-            for info in sample_infos:
-                key = (info["low_note"], info["high_note"])
-                note_layers[key].append(info)
-                
+            # Group samples by their key range to create keygroups. One sort
+            # orders the keygroups by range and each keygroup's layers by
+            # velocity, so groupby hands back every keygroup ready to build.
+            def key_range(info):
+                return info["low_note"], info["high_note"]
+
+            ordered_infos = sorted(
+                sample_infos,
+                key=lambda info: (*key_range(info), info.get("velocity_low", 0)),
+            )
+            keygroups = [
+                (key, list(layers))
+                for key, layers in groupby(ordered_infos, key=key_range)
+            ]
+
             # Store both the total sample count and the keygroup count
             sample_count = len(sample_infos)
-            keygroup_count = len(note_layers)
+            keygroup_count = len(keygroups)
             
             # Log if there's a mismatch between samples and keygroups
             if sample_count != keygroup_count:
@@ -3366,17 +3978,12 @@ class InstrumentBuilder:
             )
             ET.SubElement(program, pads_tag).text = pads_json_str
 
-            program_params = self.get_program_parameters(keygroup_count)
-            program_params["KeygroupLegacyMode"] = (
-                "True" if self.options.format_version == "legacy" else "False"
-            )
-            for key, val in program_params.items():
+            for key, val in self._program_parameter_items(keygroup_count):
                 ET.SubElement(program, key).text = val
 
             # Build the critical <Instruments> section
             instruments = ET.SubElement(program, "Instruments")
-            sorted_keys = sorted(note_layers.keys())
-            for i, key in enumerate(sorted_keys):
+            for i, (key, layers_for_note) in enumerate(keygroups):
                 low_key, high_key = key
                 inst = self.build_instrument_element(instruments, i, low_key, high_key)
                 if instrument_template:
@@ -3388,30 +3995,35 @@ class InstrumentBuilder:
                             ET.SubElement(inst, k).text = str(v)
                 layers_elem = ET.SubElement(inst, "Layers")
 
-                layers_for_note = sorted(
-                    note_layers[key], key=lambda x: x.get("velocity_low", 0)
-                )
                 num_layers = min(len(layers_for_note), 8)
                 vel_split = 128 // num_layers
-
-                for lidx, sample_info in enumerate(layers_for_note[:num_layers]):
+                # Default velocity range of each layer; the top one ends at 127
+                vel_bounds = [
+                    (i * vel_split, (i + 1) * vel_split - 1) for i in range(num_layers)
+                ]
+                vel_bounds[-1] = (vel_bounds[-1][0], 127)
+
+                for lidx, (sample_info, (default_start, default_end)) in enumerate(
+                    zip(layers_for_note, vel_bounds)
+                ):
                     layer = ET.SubElement(
                         layers_elem, "Layer", {"number": str(lidx + 1)}
                     )
-                    vel_start = sample_info.get("velocity_low", lidx * vel_split)
-                    vel_end = sample_info.get(
-                        "velocity_high",
-                        (lidx + 1) * vel_split - 1 if lidx < num_layers - 1 else 127,
-                    )
+                    vel_start = sample_info.get("velocity_low", default_start)
+                    vel_end = sample_info.get("velocity_high", default_end)
                     self.add_layer_parameters(layer, sample_info, vel_start, vel_end)
                     self.apply_creative_mode(inst, layer, lidx, num_layers)
 
             output_path = os.path.join(output_folder, f"{program_name}.xpm")
             tree = ET.ElementTree(root)
-            indent_tree(tree)
-            tree.write(output_path, encoding="utf-8", xml_declaration=True)
-
-            if not validate_xpm_file(output_path, len(sample_infos)):
+            # Validate the tree just built rather than reading the file back,
+            # so any fix goes out with the one write below.
+            is_valid = validate_xpm_file(output_path, len(sample_infos), tree=tree)
+            # Written without an indent pass; the MPC does not need the
+            # whitespace.
+            _write_xpm_tree(tree, output_path)
+
+            if not is_valid:
                 logging.warning(
                     f"Post-creation validation failed for {os.path.basename(output_path)}"
                 )
@@ -3434,14 +4046,49 @@ class InstrumentBuilder:
             engine_override=self.options.format_version,
         )
 
-    def build_instrument_element(self, parent, num, low, high):
-        instrument = ET.SubElement(parent, "Instrument", {"number": str(num)})
+    def _program_parameter_items(self, num_keygroups):
+        """Return the program-level ``(tag, text)`` pairs for ``_create_xpm``.
+
+        They only depend on the firmware, format and keygroup count, so each
+        combination is built once and reused for every program.
+        """
+        key = (
+            self.options.firmware_version,
+            self.options.format_version,
+            num_keygroups,
+        )
+        items = self._program_params_cache.get(key)
+        if items is None:
+            params = self.get_program_parameters(num_keygroups)
+            params["KeygroupLegacyMode"] = (
+                "True" if self.options.format_version == "legacy" else "False"
+            )
+            items = tuple(params.items())
+            self._program_params_cache[key] = items
+        return items
+
+    def _instrument_parameter_defaults(self):
+        """Return the instrument parameters shared by every keygroup.
+
+        They only depend on the firmware, format and polyphony, so they are
+        built once per combination. ``LowNote`` and ``HighNote`` hold
+        placeholders that ``build_instrument_element`` fills in.
+        """
+        key = (
+            self.options.firmware_version,
+            self.options.format_version,
+            self.options.polyphony,
+        )
+        params = self._instrument_params_cache.get(key)
+        if params is not None:
+            return params
+
         if not IMPORTS_SUCCESSFUL:
             # Fallback for missing imports
             params = {
                 "Polyphony": str(self.options.polyphony),
-                "LowNote": str(low),
-                "HighNote": str(high),
+                "LowNote": "",
+                "HighNote": "",
             }
         else:
             engine = get_pad_settings(
@@ -3456,8 +4103,8 @@ class InstrumentBuilder:
             params.update(
                 {
                     "Polyphony": str(self.options.polyphony),
-                    "LowNote": str(low),
-                    "HighNote": str(high),
+                    "LowNote": "",
+                    "HighNote": "",
                 }
             )
 
@@ -3485,13 +4132,24 @@ class InstrumentBuilder:
                 }
                 params.update(legacy_defaults)
 
+        self._instrument_params_cache[key] = params
+        return params
+
+    def build_instrument_element(self, parent, num, low, high):
+        SubElement = ET.SubElement
+        instrument = SubElement(parent, "Instrument", {"number": str(num)})
+        # Copying keeps LowNote and HighNote at their place in the defaults
+        params = self._instrument_parameter_defaults().copy()
+        params["LowNote"] = str(low)
+        params["HighNote"] = str(high)
         for key, val in params.items():
-            ET.SubElement(instrument, key).text = val
+            SubElement(instrument, key).text = val
         return instrument
 
     # REVISED: This function now preserves all layer parameters
     def add_layer_parameters(self, layer_element, sample_info, vel_start, vel_end):
-        sample_name, _ = os.path.splitext(os.path.basename(sample_info["sample_path"]))
+        # sample_path is always stored with "/" separators
+        sample_name = _split_ext(sample_info["sample_path"].rpartition("/")[2])[0]
         frames = sample_info.get("frames", 0)
 
         # Start with defaults, then override with preserved values
@@ -3527,8 +4185,9 @@ class InstrumentBuilder:
                 "LoopEnd", str(max(frames - 1, 0))
             )
 
+        SubElement = ET.SubElement
         for key, value in params.items():
-            ET.SubElement(layer_element, key).text = str(value)
+            SubElement(layer_element, key).text = str(value)
 
     def apply_creative_mode(
         self, instrument_element, layer_element, layer_index, total_layers
@@ -3595,7 +4254,7 @@ class InstrumentBuilder:
         self.app.progress.config(mode="indeterminate")
         self.app.progress.start()
         folder = self.folder_path
-        xpm_files = glob.glob(os.path.join(folder, "**", "*.xpm"), recursive=True)
+        xpm_files = list(_iter_xpms(folder))
         if not xpm_files:
             self._show_info_safe(
                 "No XPMs Found", "No .xpm files were found to generate previews for."
@@ -3604,80 +4263,64 @@ class InstrumentBuilder:
             self.app.progress.config(mode="determinate")
             return
 
-        preview_count = 0
-        for xpm_path in xpm_files:
-            try:
-                preview_folder_path = os.path.join(
-                    os.path.dirname(xpm_path), "[Previews]"
-                )
-                os.makedirs(preview_folder_path, exist_ok=True)
+        # Each preview is a parse of one program plus one file copy, and no
+        # two programs share a preview file, so they are made in parallel.
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            preview_count = sum(executor.map(self._generate_one_preview, xpm_files))
 
-                tree = ET.parse(xpm_path)
-                root = tree.getroot()
-                preview_sample_name = None
+        self.app.progress.stop()
+        self.app.progress.config(mode="determinate")
+        self.app.status_text.set("Preview generation complete.")
+        logging.info(
+            f"Generated {preview_count} previews for {len(xpm_files)} programs."
+        )
+        self._show_info_safe("Done", f"Generated {preview_count} new audio previews.")
 
-                # Modern format check (JSON inside ProgramPads)
-                pads_elem = find_program_pads(root)
-                if pads_elem is not None and pads_elem.text:
-                    pads_data = json.loads(xml_unescape(pads_elem.text))
-                    pads = pads_data.get("pads", {})
-                    # Find first valid sample path
-                    for i in range(128):
-                        pad = pads.get(f"value{i}")
-                        if isinstance(pad, dict) and pad.get("samplePath"):
-                            preview_sample_name = pad["samplePath"]
-                            break
-
-                # Legacy format check (if no ProgramPads or no sample found in it)
-                if not preview_sample_name:
-                    first_sample_elem = root.find(".//Layer/SampleName")
-                    if first_sample_elem is not None and first_sample_elem.text:
-                        preview_sample_name = first_sample_elem.text + ".wav"
-
-                if preview_sample_name:
-                    xpm_dir = os.path.dirname(xpm_path)
-                    sample_basename = os.path.basename(
-                        preview_sample_name.replace("/", os.sep)
-                    )
-                    source_sample_abs = os.path.join(xpm_dir, sample_basename)
-
-                    if os.path.exists(source_sample_abs):
-                        program_name = os.path.splitext(os.path.basename(xpm_path))[0]
-                        preview_filename = f"{program_name}.xpm.wav"
-                        dest_path = os.path.join(preview_folder_path, preview_filename)
-                        if not os.path.exists(dest_path):
-                            shutil.copy2(source_sample_abs, dest_path)
-                            preview_count += 1
-                            logging.info(
-                                f"Generated preview for {os.path.basename(xpm_path)}"
-                            )
-                    else:
-                        logging.warning(
-                            f"Preview source sample not found for {os.path.basename(xpm_path)}. Looked for: {source_sample_abs}"
-                        )
+    def _generate_one_preview(self, xpm_path):
+        """Copy the first sample of ``xpm_path`` into its ``[Previews]`` folder.
+
+        Returns True if a new preview file was written.
+        """
+        xpm_dir, xpm_base = os.path.split(xpm_path)
+        try:
+            preview_folder_path = os.path.join(xpm_dir, "[Previews]")
+            os.makedirs(preview_folder_path, exist_ok=True)
+
+            preview_sample_name = _find_preview_sample(xpm_path)
+
+            if preview_sample_name:
+                sample_basename = os.path.basename(
+                    preview_sample_name.replace("/", os.sep)
+                )
+                source_sample_abs = os.path.join(xpm_dir, sample_basename)
+
+                if os.path.exists(source_sample_abs):
+                    program_name = os.path.splitext(xpm_base)[0]
+                    preview_filename = f"{program_name}.xpm.wav"
+                    dest_path = os.path.join(preview_folder_path, preview_filename)
+                    if not os.path.exists(dest_path):
+                        # A preview needs the audio only, not the source's
+                        # timestamps and mode, and copyfile lets the kernel
+                        # copy the data where it can.
+                        shutil.copyfile(source_sample_abs, dest_path)
+                        logging.debug("Generated preview for %s", xpm_base)
+                        return True
                 else:
                     logging.warning(
-                        f"Could not find any sample reference in {os.path.basename(xpm_path)}."
+                        f"Preview source sample not found for {xpm_base}. Looked for: {source_sample_abs}"
                     )
+            else:
+                logging.warning(f"Could not find any sample reference in {xpm_base}.")
 
-            except Exception as e:
-                logging.error(
-                    f"Failed to generate preview for {os.path.basename(xpm_path)}: {e}"
-                )
-
-        self.app.progress.stop()
-        self.app.progress.config(mode="determinate")
-        self.app.status_text.set("Preview generation complete.")
-        self._show_info_safe("Done", f"Generated {preview_count} new audio previews.")
+        except Exception as e:
+            logging.error(f"Failed to generate preview for {xpm_base}: {e}")
+        return False
 
     def group_wav_files(self, mode):
         """Groups WAV files by instrument name for XPM creation."""
-        search_path = (
-            os.path.join(self.folder_path, "**", "*.wav")
-            if self.options.recursive_scan
-            else os.path.join(self.folder_path, "*.wav")
+        all_wavs = _iter_ext(
+            self.folder_path, ".wav", recursive=self.options.recursive_scan
         )
-        all_wavs = glob.glob(search_path, recursive=self.options.recursive_scan)
 
         groups = defaultdict(list)
         for wav_path in all_wavs:
@@ -3690,12 +4333,72 @@ class InstrumentBuilder:
                 instrument_name = os.path.splitext(os.path.basename(wav_path))[0]
                 groups[instrument_name].append(relative_path)
             else:
-                instrument_name = get_base_instrument_name(wav_path)
+                instrument_name = _base_instrument_cached(wav_path)
                 groups[instrument_name].append(relative_path)
         return groups
 
-    def validate_sample_info(self, sample_path):
-        """Validates a WAV file and extracts info. Detects SCWs if enabled."""
+    def validate_batch(self, paths):
+        """Return ``_cached_sample_info`` for each of ``paths``, in order.
+
+        Samples without a note in their name need a pitch detection, which
+        is CPU bound, so those are first analysed together in audio_pitch's
+        process pool; ``validate_sample_info`` then finds them in the pitch
+        cache. The remaining header reads go through a thread pool shared
+        by every builder, so programs rebuilt in parallel by
+        ``batch_edit_programs`` still read at most ``SAMPLE_INFO_WORKERS``
+        samples at a time. Each name is parsed for a note once, here, and
+        the result passed on to ``validate_sample_info``.
+        """
+        if IMPORTS_SUCCESSFUL:
+            notes = [infer_note_from_filename(path) for path in paths]
+            unnamed = [
+                path
+                for path, note in zip(paths, notes)
+                if note is None and path.lower().endswith(".wav")
+            ]
+            if len(unnamed) > 1:
+                try:
+                    detect_fundamental_pitch_batch(unnamed)
+                except Exception as e:
+                    # validate_sample_info still detects each pitch itself
+                    logging.warning(f"Batch pitch detection failed: {e}")
+        else:
+            notes = [None] * len(paths)
+        if len(paths) < 2:
+            return list(map(self._cached_sample_info, paths, notes))
+        return list(_SAMPLE_INFO_POOL.map(self._cached_sample_info, paths, notes))
+
+    def _cached_sample_info(self, abs_path, filename_note):
+        """Return a copy of ``validate_sample_info(abs_path, filename_note)``.
+
+        Results are reused while the file's mtime and size are unchanged, so
+        a sample shared by several programs is only read and pitch-detected
+        once. The cache is module level, so builds, previews and rebuilds
+        share it even though each makes its own builder. Callers get a copy
+        because they fill in per-program fields.
+        """
+        try:
+            st = os.stat(abs_path)
+        except OSError:
+            return self.validate_sample_info(abs_path, filename_note)
+        key = (abs_path, st.st_mtime_ns, st.st_size, self.options.analyze_scw)
+        with _SAMPLE_INFO_LOCK:
+            info = _SAMPLE_INFO_CACHE.get(key)
+        if info is None:
+            info = self.validate_sample_info(abs_path, filename_note)
+            if info.get("is_valid"):
+                with _SAMPLE_INFO_LOCK:
+                    if len(_SAMPLE_INFO_CACHE) >= SAMPLE_INFO_CACHE_SIZE:
+                        del _SAMPLE_INFO_CACHE[next(iter(_SAMPLE_INFO_CACHE))]
+                    _SAMPLE_INFO_CACHE[key] = info
+        return dict(info)
+
+    def validate_sample_info(self, sample_path, filename_note):
+        """Validates a WAV file and extracts info. Detects SCWs if enabled.
+
+        ``filename_note`` is ``infer_note_from_filename(sample_path)``; the
+        pitch is only detected when it is None.
+        """
         try:
             if not os.path.exists(sample_path) or not sample_path.lower().endswith(
                 ".wav"
@@ -3708,7 +4411,7 @@ class InstrumentBuilder:
                 is_scw = True
 
             # REVISED: Prioritize filename, then pitch detection
-            root_note = infer_note_from_filename(sample_path)
+            root_note = filename_note
             if root_note is None:
                 root_note = detect_fundamental_pitch(sample_path)
 
@@ -3748,6 +4451,12 @@ class App(tk.Tk):
         self.creative_config = {}
         self.last_browse_path = os.path.expanduser("~")  # Remember last path
 
+        # Heavy batch operations run one at a time on a single worker thread
+        self._job_queue = queue.Queue()
+        self.cancel_event = threading.Event()
+        self._worker = threading.Thread(target=self._run_jobs, daemon=True)
+        self._worker.start()
+
         self.setup_retro_theme()
 
         main_frame = ttk.Frame(self, padding="10", style="Retro.TFrame")
@@ -3766,6 +4475,34 @@ class App(tk.Tk):
 
         self.setup_logging()
 
+    def submit_job(self, func, *args):
+        """Queue ``func(*args)`` to run on the background worker thread.
+
+        A cancel requested before this point is forgotten. One requested
+        later also stops this job, even while it is still queued.
+        """
+        self.cancel_event.clear()
+        self._job_queue.put((func, args))
+
+    def _run_jobs(self):
+        """Worker loop executing queued jobs in submission order."""
+        while True:
+            func, args = self._job_queue.get()
+            try:
+                func(*args)
+            except Exception as e:
+                logging.error(
+                    f"Background job {getattr(func, '__name__', func)} failed: {e}\n"
+                    f"{traceback.format_exc()}"
+                )
+            finally:
+                self._job_queue.task_done()
+
+    def cancel_job(self):
+        """Ask the running and queued jobs to stop at their next checkpoint."""
+        self.cancel_event.set()
+        logging.info("Cancellation requested.")
+
     def _safe_file_dialog(self, dialog_type='folder', **kwargs):
         """Safely handle file dialogs to prevent macOS NSInvalidArgumentException"""
         try:
@@ -3828,12 +4565,28 @@ class App(tk.Tk):
 
         file_handler = logging.FileHandler("converter.log", mode="a", encoding="utf-8")
         file_handler.setFormatter(log_format)
-        root_logger.addHandler(file_handler)
 
-        root_logger.addHandler(text_handler)
+        # Worker threads only enqueue records; one listener thread writes the
+        # log file and feeds the text handler, so the batch pool never waits
+        # on the file handler's lock or its per-record flush.
+        log_queue = queue.Queue(-1)
+        root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        self.log_listener = logging.handlers.QueueListener(
+            log_queue, file_handler, text_handler
+        )
+        self.log_listener.start()
+        atexit.register(self.log_listener.stop)
+
         root_logger.setLevel(logging.INFO)
+        self.text_handler = text_handler
+        self.root.after(LOG_FLUSH_INTERVAL_MS, self._flush_log)
         logging.info(f"Application started. Version {APP_VERSION}.")
 
+    def _flush_log(self):
+        """Drain buffered log records into the log view and reschedule."""
+        self.text_handler.flush_to_widget()
+        self.root.after(LOG_FLUSH_INTERVAL_MS, self._flush_log)
+
     # <editor-fold desc="GUI Creation Methods">
     def setup_retro_theme(self):
         style = ttk.Style(self)
@@ -4027,22 +4780,22 @@ class App(tk.Tk):
         ttk.Button(
             frame,
             text="Single-Cycle Waveform (SCW) Tool...",
-            command=lambda: self.open_window(SCWToolWindow),
+            command=functools.partial(self.open_window, SCWToolWindow),
         ).grid(row=0, column=0, sticky="ew", padx=2, pady=2)
         ttk.Button(
             frame,
             text="Batch Program Editor...",
-            command=lambda: self.open_window(BatchProgramEditorWindow),
+            command=functools.partial(self.open_window, BatchProgramEditorWindow),
         ).grid(row=0, column=1, sticky="ew", padx=2, pady=2)
         ttk.Button(
             frame,
             text="Batch Program Fixer...",
-            command=lambda: self.open_window(BatchProgramFixerWindow),
+            command=functools.partial(self.open_window, BatchProgramFixerWindow),
         ).grid(row=1, column=0, columnspan=2, sticky="ew", padx=2, pady=2)
         ttk.Button(
             frame,
             text="Sample Mapping Checker...",
-            command=lambda: self.open_window(SampleMappingCheckerWindow),
+            command=functools.partial(self.open_window, SampleMappingCheckerWindow),
         ).grid(row=2, column=0, columnspan=2, sticky="ew", padx=2, pady=2)
 
     def create_quick_edits_frame(self, parent):
@@ -4105,6 +4858,7 @@ class App(tk.Tk):
             height=10,
             wrap="word",
             state="disabled",
+            undo=False,
             bg=MPC_WHITE,
             fg=MPC_DARK_GREY,
         )
@@ -4131,6 +4885,9 @@ class App(tk.Tk):
             frame, orient="horizontal", length=150, mode="determinate"
         )
         self.progress.grid(row=0, column=1, sticky="e")
+        ttk.Button(frame, text="Cancel", command=self.cancel_job).grid(
+            row=0, column=2, sticky="e", padx=(5, 0)
+        )
 
     # </editor-fold>
 
@@ -4165,6 +4922,15 @@ class App(tk.Tk):
                 logging.info(f"Selected folder (fallback): {folder}")
             logging.info(f"Selected folder: {folder}")
 
+    def _list_xpms(self, folder):
+        """Return the XPM paths below ``folder``.
+
+        The folder is scanned afresh for every action: directory mtimes on
+        FAT/exFAT cards are too coarse to tell whether a cached listing is
+        still current.
+        """
+        return list(_iter_xpms(folder))
+
     def on_creative_mode_change(self, event=None):
         """Enable config button only for configurable modes."""
         configurable_modes = ["synth", "lofi"]
@@ -4342,7 +5108,7 @@ class App(tk.Tk):
                 self.status_text.set("Ready.")
 
         self.status_text.set(f"Running {process_func.__name__}...")
-        threading.Thread(target=run, daemon=True).start()
+        self.submit_job(run)
 
     def run_set_all_to_mono(self):
         """Wrapper to run the set_to_mono function in a thread."""
@@ -4365,7 +5131,9 @@ class App(tk.Tk):
             self.progress.config(mode="indeterminate")
             self.progress.start()
             try:
-                count = quick_edit_set_mono(folder)
+                count = quick_edit_set_mono(
+                    folder, self.cancel_event, self._list_xpms(folder)
+                )
                 self.root.after_idle(
                     lambda: messagebox.showinfo(
                         "Success",
@@ -4387,7 +5155,7 @@ class App(tk.Tk):
                 self.progress.config(mode="determinate")
                 self.status_text.set("Ready.")
 
-        threading.Thread(target=run, daemon=True).start()
+        self.submit_job(run)
 
     def run_normalize_levels(self):
         """Wrapper to run the normalize levels function in a thread."""
@@ -4410,7 +5178,9 @@ class App(tk.Tk):
             self.progress.config(mode="indeterminate")
             self.progress.start()
             try:
-                count = quick_edit_normalize_levels(folder)
+                count = quick_edit_normalize_levels(
+                    folder, self.cancel_event, self._list_xpms(folder)
+                )
                 self.root.after_idle(
                     lambda: messagebox.showinfo(
                         "Success",
@@ -4432,7 +5202,7 @@ class App(tk.Tk):
                 self.progress.config(mode="determinate")
                 self.status_text.set("Ready.")
 
-        threading.Thread(target=run, daemon=True).start()
+        self.submit_job(run)
 
     def run_clean_all_previews(self):
         """Wrapper to run the clean previews function in a thread."""
@@ -4480,14 +5250,14 @@ class App(tk.Tk):
                 self.progress.config(mode="determinate")
                 self.status_text.set("Ready.")
 
-        threading.Thread(target=run, daemon=True).start()
+        self.submit_job(run)
 
     def open_merge_subfolders(self):
         self.open_window(MergeSubfoldersWindow)
 
     def generate_previews(self):
         builder = InstrumentBuilder(self.folder_path.get(), self, InstrumentOptions())
-        threading.Thread(target=builder.process_previews_only, daemon=True).start()
+        self.submit_job(builder.process_previews_only)
 
     def package_expansion(self):
         folder = self.folder_path.get()
@@ -4525,17 +5295,21 @@ class App(tk.Tk):
                         )
 
                 self.status_text.set("Creating ZIP archive...")
-                with zipfile.ZipFile(save_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-                    for root, dirs, files in os.walk(folder):
-                        for file in files:
-                            if os.path.join(root, file) == save_path:
-                                continue
-                            zipf.write(
-                                os.path.join(root, file),
-                                os.path.relpath(
-                                    os.path.join(root, file), os.path.dirname(folder)
-                                ),
-                            )
+                # Archive names are relative to the folder's parent, so slice
+                # the prefix off instead of calling os.path.relpath per file.
+                prefix_len = len(os.path.join(os.path.dirname(folder), ""))
+                with zipfile.ZipFile(
+                    save_path,
+                    "w",
+                    zipfile.ZIP_DEFLATED,
+                    compresslevel=ZIP_COMPRESS_LEVEL,
+                ) as zipf:
+                    # Everything in the folder ships, hidden files included
+                    entries = _iter_file_entries(folder, include_hidden=True)
+                    for entry in _prefetch_ahead(entries):
+                        if entry.path == save_path:
+                            continue
+                        _write_zip_entry(zipf, entry, entry.path[prefix_len:])
 
                 logging.info(f"Expansion successfully packaged to {save_path}")
                 self.root.after_idle(
@@ -4558,7 +5332,7 @@ class App(tk.Tk):
                 self.progress.config(mode="determinate")
                 self.status_text.set("Ready.")
 
-        threading.Thread(target=run, daemon=True).start()
+        self.submit_job(run)
 
 
 def merge_subfolders(folder_path, params):
@@ -4566,35 +5340,54 @@ def merge_subfolders(folder_path, params):
     moved_count = 0
     target_depth = params.get("target_depth", 0)
     max_depth = params.get("max_depth", 2)
-    for root, dirs, files in os.walk(folder_path, topdown=False):
-        rel = os.path.relpath(root, folder_path)
-        depth = 0 if rel == "." else len(rel.split(os.sep))
-        if depth == 0 or depth > max_depth or depth <= target_depth:
-            continue
-        dest_dir = (
-            folder_path
-            if target_depth == 0
-            else os.path.join(folder_path, *rel.split(os.sep)[:target_depth])
-        )
-        os.makedirs(dest_dir, exist_ok=True)
+    dest_names = {}  # destination folder -> names already taken there
+
+    def merge(root, depth, dest_dir):
+        # Same bottom-up order as os.walk(topdown=False), but the depth is
+        # carried down and folders below max_depth are never listed.
+        nonlocal moved_count
+        try:
+            with os.scandir(root) as it:
+                entries = list(it)
+        except OSError:
+            return
+        files = []
+        for entry in entries:
+            if not entry.is_dir():
+                files.append(entry.name)
+            elif depth < max_depth and not entry.is_symlink():
+                child_dest = entry.path if depth < target_depth else dest_dir
+                merge(entry.path, depth + 1, child_dest)
+        if depth <= target_depth:
+            return
+
+        taken = dest_names.get(dest_dir)
+        if taken is None:
+            taken = dest_names[dest_dir] = _dir_names(dest_dir)
         for file in files:
             src_path = os.path.join(root, file)
-            dest_path = os.path.join(dest_dir, file)
-            if os.path.exists(dest_path):
+            dest_name = file
+            if dest_name.casefold() in taken:
                 subfolder_name = os.path.basename(root)
                 name, ext = os.path.splitext(file)
-                dest_path = os.path.join(dest_dir, f"{subfolder_name}_{name}{ext}")
+                dest_name = f"{subfolder_name}_{name}{ext}"
             try:
-                shutil.move(src_path, dest_path)
+                _move_file(src_path, os.path.join(dest_dir, dest_name))
+                taken.add(dest_name.casefold())
                 moved_count += 1
             except Exception as e:
                 logging.error(f"Could not move {src_path}: {e}")
         if not os.listdir(root):
             try:
                 os.rmdir(root)
+                parent_names = dest_names.get(os.path.dirname(root))
+                if parent_names is not None:
+                    parent_names.discard(os.path.basename(root).casefold())
                 logging.info(f"Removed empty subfolder: {root}")
             except OSError as e:
                 logging.warning(f"Could not remove directory {root}: {e}")
+
+    merge(folder_path, 0, folder_path)
     return moved_count
 
 
@@ -4607,32 +5400,43 @@ def split_files_smartly(folder_path, params):
     """Organizes XPMs and WAVs into subfolders based on the chosen mode."""
     moved_count = 0
     mode = params.get("mode", "word")
+    dest_names = {}  # subfolder -> names already taken there
 
-    # First process XPM files so samples move with them
-    xpm_files = glob.glob(os.path.join(folder_path, "*.xpm"))
+    # First process XPM files so samples move with them. The listings are
+    # taken up front because files are moved out of the folder as they go.
+    xpm_files = list(_iter_ext(folder_path, ".xpm", recursive=False))
     for xpm_path in xpm_files:
         try:
             basename = os.path.basename(xpm_path)
             subfolder_name = None
 
             if mode == "word":
-                subfolder_name = basename.split(" ")[0].split("_")[0].split("-")[0]
+                subfolder_name = basename.translate(_WORD_SEPARATORS).split(" ", 1)[0]
             elif mode == "prefix":
-                m = re.match(r"([A-Za-z0-9]+[_-])", basename)
+                m = _PREFIX_RE.match(basename)
                 if m:
                     subfolder_name = m.group(1).strip("_-")
             else:  # category
+                # The highest-ranked tag wins wherever it appears, so only a
+                # head that already holds it spares reading the rest.
                 with open(xpm_path, "r", encoding="utf-8", errors="ignore") as f:
-                    xpm_text = f.read()
+                    xpm_text = f.read(CATEGORY_HEAD_CHARS)
+                    head_category = get_instrument_category_from_text(xpm_text)
+                    if head_category != _INSTRUMENT_TAGS[0]:
+                        xpm_text += f.read()
                 subfolder_name = get_base_instrument_name(xpm_path, xpm_text)
 
             if not subfolder_name:
                 continue
 
             subfolder_path = os.path.join(folder_path, subfolder_name)
-            os.makedirs(subfolder_path, exist_ok=True)
+            taken = dest_names.get(subfolder_path)
+            if taken is None:
+                os.makedirs(subfolder_path, exist_ok=True)
+                taken = dest_names[subfolder_path] = _dir_names(subfolder_path)
             dest_xpm = os.path.join(subfolder_path, basename)
-            shutil.move(xpm_path, dest_xpm)
+            _move_file(xpm_path, dest_xpm)
+            taken.add(basename.casefold())
             moved_count += 1
 
             for sample in parse_xpm_samples(dest_xpm):
@@ -4643,14 +5447,14 @@ def split_files_smartly(folder_path, params):
                     else sample_norm
                 )
                 if os.path.exists(sample_abs):
-                    dest_sample = os.path.join(
-                        subfolder_path, os.path.basename(sample_norm)
-                    )
-                    if os.path.exists(dest_sample):
-                        base, ext = os.path.splitext(os.path.basename(sample_norm))
-                        dest_sample = os.path.join(subfolder_path, f"{base}_1{ext}")
+                    sample_name = os.path.basename(sample_norm)
+                    if sample_name.casefold() in taken:
+                        base, ext = os.path.splitext(sample_name)
+                        sample_name = f"{base}_1{ext}"
                     try:
-                        shutil.move(sample_abs, dest_sample)
+                        dest_sample = os.path.join(subfolder_path, sample_name)
+                        _move_file(sample_abs, dest_sample)
+                        taken.add(sample_name.casefold())
                         moved_count += 1
                     except Exception as e:
                         logging.error(f"Could not move {sample_abs}: {e}")
@@ -4658,29 +5462,33 @@ def split_files_smartly(folder_path, params):
             logging.error(f"Could not process {xpm_path}: {e}")
 
     # Now process remaining WAV files
-    all_wavs = glob.glob(os.path.join(folder_path, "*.wav"))
+    all_wavs = list(_iter_ext(folder_path, ".wav", recursive=False))
     for wav_path in all_wavs:
         try:
             subfolder_name = None
             basename = os.path.basename(wav_path)
 
             if mode == "word":
-                subfolder_name = basename.split(" ")[0].split("_")[0].split("-")[0]
+                subfolder_name = basename.translate(_WORD_SEPARATORS).split(" ", 1)[0]
             elif mode == "prefix":
-                match = re.match(r"([A-Za-z0-9]+[_-])", basename)
+                match = _PREFIX_RE.match(basename)
                 if match:
                     subfolder_name = match.group(1).strip("_-")
             else:  # category
-                subfolder_name = get_base_instrument_name(wav_path)
+                subfolder_name = _base_instrument_cached(wav_path)
 
             if subfolder_name:
                 subfolder_path = os.path.join(folder_path, subfolder_name)
-                os.makedirs(subfolder_path, exist_ok=True)
-                dest_path = os.path.join(subfolder_path, basename)
-                if os.path.exists(dest_path):
+                taken = dest_names.get(subfolder_path)
+                if taken is None:
+                    os.makedirs(subfolder_path, exist_ok=True)
+                    taken = dest_names[subfolder_path] = _dir_names(subfolder_path)
+                dest_name = basename
+                if dest_name.casefold() in taken:
                     base, ext = os.path.splitext(basename)
-                    dest_path = os.path.join(subfolder_path, f"{base}_1{ext}")
-                shutil.move(wav_path, dest_path)
+                    dest_name = f"{base}_1{ext}"
+                _move_file(wav_path, os.path.join(subfolder_path, dest_name))
+                taken.add(dest_name.casefold())
                 moved_count += 1
         except Exception as e:
             logging.error(f"Could not split file {wav_path}: {e}")
@@ -4688,27 +5496,69 @@ def split_files_smartly(folder_path, params):
     return moved_count
 
 
-def quick_edit_set_mono(folder_path):
+def _xpm_has_other_value(path, parent_tag, tag, value):
+    """Return True if any ``parent_tag/tag`` element in ``path`` is not ``value``.
+
+    The document is streamed with ``iterparse`` and finished elements are
+    cleared, so programs that already hold the value are checked without
+    keeping a full tree in memory.
+    """
+    parents = []
+    for event, elem in ET.iterparse(path, events=("start", "end")):
+        if event == "start":
+            parents.append(elem.tag)
+            continue
+        parents.pop()
+        if elem.tag == tag and parents and parents[-1] == parent_tag:
+            if elem.text != value:
+                return True
+        elem.clear()
+    return False
+
+
+def _iter_child_tags(root, parent_tag, tag):
+    """Yield ``tag`` elements that are direct children of ``parent_tag``.
+
+    Equivalent to ``root.findall(".//parent_tag/tag")`` but driven by the
+    C-level ``Element.iter`` instead of the interpreted path matcher.
+    """
+    for parent in root.iter(parent_tag):
+        for child in parent:
+            if child.tag == tag:
+                yield child
+
+
+def quick_edit_set_mono(folder_path, cancel_event=None, xpms=None):
     """
     Iterates through all XPM files and sets their VoiceOverlap to Mono.
     This is a direct XML edit for speed.
     """
+    if xpms is None:
+        xpms = _iter_xpms(folder_path)
     count = 0
-    xpm_files = glob.glob(os.path.join(folder_path, "**", "*.xpm"), recursive=True)
-    for path in xpm_files:
+    for path in xpms:
+        if cancel_event is not None and cancel_event.is_set():
+            logging.info(f"Mono edit cancelled after {count} program(s).")
+            break
         try:
+            if not _xpm_has_other_value(path, "Instrument", "VoiceOverlap", "Mono"):
+                continue
             tree = ET.parse(path)
             root = tree.getroot()
             changed = False
             # Find all VoiceOverlap tags within any Instrument
-            for vo_element in root.findall(".//Instrument/VoiceOverlap"):
+            for vo_element in _iter_child_tags(root, "Instrument", "VoiceOverlap"):
                 if vo_element.text != "Mono":
                     vo_element.text = "Mono"
                     changed = True
 
             if changed:
-                indent_tree(tree)
+                # Only element text changed, so the existing indentation is
+                # still correct. The parser drops the trailing newline, which
+                # indent_tree used to restore.
+                root.tail = "\n"
                 tree.write(path, encoding="utf-8", xml_declaration=True)
+                _forget_xpm_tree(path)
                 count += 1
                 logging.info(f"Set {os.path.basename(path)} to Mono.")
         except ET.ParseError as e:
@@ -4718,27 +5568,37 @@ def quick_edit_set_mono(folder_path):
     return count
 
 
-def quick_edit_normalize_levels(folder_path):
+def quick_edit_normalize_levels(folder_path, cancel_event=None, xpms=None):
     """
     Iterates through all XPM files and sets their instrument Volume to 0.95.
     This is a direct XML edit for speed.
     """
+    if xpms is None:
+        xpms = _iter_xpms(folder_path)
     count = 0
-    xpm_files = glob.glob(os.path.join(folder_path, "**", "*.xpm"), recursive=True)
-    for path in xpm_files:
+    for path in xpms:
+        if cancel_event is not None and cancel_event.is_set():
+            logging.info(f"Normalize edit cancelled after {count} program(s).")
+            break
         try:
+            if not _xpm_has_other_value(path, "Instrument", "Volume", "0.95"):
+                continue
             tree = ET.parse(path)
             root = tree.getroot()
             changed = False
             # Find all Volume tags within any Instrument
-            for vol_element in root.findall(".//Instrument/Volume"):
+            for vol_element in _iter_child_tags(root, "Instrument", "Volume"):
                 if vol_element.text != "0.95":
                     vol_element.text = "0.95"
                     changed = True
 
             if changed:
-                indent_tree(tree)
+                # Only element text changed, so the existing indentation is
+                # still correct. The parser drops the trailing newline, which
+                # indent_tree used to restore.
+                root.tail = "\n"
                 tree.write(path, encoding="utf-8", xml_declaration=True)
+                _forget_xpm_tree(path)
                 count += 1
                 logging.info(f"Normalized volume for {os.path.basename(path)}.")
         except ET.ParseError as e:
@@ -4751,22 +5611,52 @@ def quick_edit_normalize_levels(folder_path):
 def clean_all_previews(folder_path):
     """
     Recursively finds and deletes all folders named '[Previews]'.
+    Preview folders are removed as soon as they are found, so their
+    contents are never listed.
     """
     deleted_count = 0
-    for root, dirs, files in os.walk(folder_path):
-        for d in dirs:
-            if d.lower() == "[previews]":
-                dir_to_delete = os.path.join(root, d)
-                try:
-                    shutil.rmtree(dir_to_delete)
-                    logging.info(f"Deleted preview folder: {dir_to_delete}")
-                    deleted_count += 1
-                except OSError as e:
-                    logging.error(f"Error deleting folder {dir_to_delete}: {e}")
+    stack = [folder_path]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                subdirs = [e for e in it if e.is_dir(follow_symlinks=False)]
+        except OSError as e:
+            logging.error(f"Could not scan {current}: {e}")
+            continue
+        for entry in subdirs:
+            if entry.name.lower() != "[previews]":
+                stack.append(entry.path)
+                continue
+            try:
+                shutil.rmtree(entry.path)
+                logging.info(f"Deleted preview folder: {entry.path}")
+                deleted_count += 1
+            except OSError as e:
+                logging.error(f"Error deleting folder {entry.path}: {e}")
     return deleted_count
 
 
-def batch_edit_programs(folder_path, params):
+# batch_edit_programs params -> instrument template parameters
+_BATCH_EDIT_PARAM_MAP = {
+    "attack": "VolumeAttack",
+    "decay": "VolumeDecay",
+    "sustain": "VolumeSustain",
+    "release": "VolumeRelease",
+    "filter_attack": "FilterAttack",
+    "filter_decay": "FilterDecay",
+    "filter_sustain": "FilterSustain",
+    "filter_release": "FilterRelease",
+    "filter_env_amount": "FilterEnvAmount",
+    "velocity_to_level": "VelocityToLevel",
+    "velocity_to_attack": "VelocityToAttack",
+    "velocity_to_start": "VelocityToStart",
+    "lfo1_rate": "Lfo1Rate",
+    "lfo1_shape": "Lfo1Shape",
+}
+
+
+def batch_edit_programs(folder_path, params, xpms=None):
     """
     Batch rebuilds XPM files, converting legacy to advanced if specified,
     and applies all user tweaks passed in the params dictionary.
@@ -4792,104 +5682,175 @@ def batch_edit_programs(folder_path, params):
     if matrix == {}:
         matrix = None
 
-    for root_dir, _dirs, files in os.walk(folder_path):
-        for file in files:
-            if not file.lower().endswith(".xpm") or file.startswith("._"):
-                continue
+    # The same tweaks apply to every program, so resolve them once
+    overrides = {
+        _BATCH_EDIT_PARAM_MAP[key]: str(value)
+        for key, value in params.items()
+        if key in _BATCH_EDIT_PARAM_MAP
+    }
+    rename = params.get("rename")
+    fix_notes = params.get("fix_notes")
+    keytrack = params.get("keytrack")
 
-            path = os.path.join(root_dir, file)
-            logging.info(f"Rebuilding program: {file}")
+    def rebuild_one(path):
+        root_dir, file = os.path.split(path)
+        base_name = os.path.splitext(file)[0]
+        logging.debug("Rebuilding program: %s", file)
 
-            try:
-                # 1. Parse the existing file to get its core data
-                mappings, existing_params = _parse_xpm_for_rebuild(path)
-                if not mappings:
-                    logging.warning(f"Could not parse mappings from {file}. Skipping.")
-                    continue
+        try:
+            # 1. Parse the existing file to get its core data. The rebuild
+            # caches a new tree for the path, so this one stays as it was.
+            original_tree = _load_xpm_tree(path)
+            mappings, existing_params = _parse_xpm_for_rebuild(path, original_tree)
+            if not mappings:
+                logging.warning(f"Could not parse mappings from {file}. Skipping.")
+                return False
 
-                # 2. Determine the program name
-                program_name = (
-                    os.path.splitext(file)[0]
-                    if params.get("rename")
-                    else existing_params.get("ProgramName", os.path.splitext(file)[0])
-                )
+            # 2. Determine the program name
+            program_name = (
+                base_name if rename else existing_params.get("ProgramName", base_name)
+            )
 
-                # 3. Create the template for the new instrument, starting with existing params
-                instrument_template = existing_params.copy()
-
-                # 4. Override template with user-specified tweaks from the params dict
-                param_map = {
-                    "attack": "VolumeAttack",
-                    "decay": "VolumeDecay",
-                    "sustain": "VolumeSustain",
-                    "release": "VolumeRelease",
-                    "filter_attack": "FilterAttack",
-                    "filter_decay": "FilterDecay",
-                    "filter_sustain": "FilterSustain",
-                    "filter_release": "FilterRelease",
-                    "filter_env_amount": "FilterEnvAmount",
-                    "velocity_to_level": "VelocityToLevel",
-                    "velocity_to_attack": "VelocityToAttack",
-                    "velocity_to_start": "VelocityToStart",
-                    "lfo1_rate": "Lfo1Rate",
-                    "lfo1_shape": "Lfo1Shape",
-                }
-                for key, value in params.items():
-                    if key in param_map:
-                        instrument_template[param_map[key]] = str(value)
+            # 3. Create the template for the new instrument, starting with existing params
+            instrument_template = existing_params.copy()
+
+            # 4. Override template with user-specified tweaks from the params dict
+            instrument_template.update(overrides)
+
+            # 5. Create a backup and then rebuild the file from scratch
+            bak_path = path + ".bak"
+            made_backup = not os.path.exists(bak_path)
+            if made_backup:
+                _fast_copy(path, bak_path)
+
+            success = builder._create_xpm(
+                program_name=program_name,
+                sample_files=[],  # Pass empty list as we are using mappings
+                output_folder=root_dir,
+                mode="multi-sample",  # This mode is best for handling mappings
+                mappings=mappings,
+                instrument_template=instrument_template,
+            )
 
-                # 5. Create a backup and then rebuild the file from scratch
-                bak_path = path + ".bak"
-                if not os.path.exists(bak_path):
-                    shutil.copy2(path, bak_path)
+            if success:
+                # Post-rebuild modifications if needed (Mod Matrix, etc.)
+                tree = _load_xpm_tree(path)
+                root = tree.getroot()
+                post_change = False
+                if matrix and apply_mod_matrix(root, matrix):
+                    post_change = True
+                if fix_notes and fix_sample_notes(root, root_dir):
+                    post_change = True
+                if fix_master_transpose(root, root_dir):
+                    post_change = True
+                if keytrack is not None and set_layer_keytrack(root, keytrack):
+                    post_change = True
+
+                if post_change:
+                    # Written compact like _create_xpm's output; the MPC
+                    # does not need indentation.
+                    _write_xpm_tree(tree, path)
+
+                # Only keep a backup this run made if the program changed.
+                # Rebuilds are written compact, so the trees are compared
+                # rather than the bytes. A rebuild saved under another name
+                # leaves the original tree in the cache, edited in place.
+                if tree is original_tree:
+                    unchanged = not post_change
+                else:
+                    unchanged = _xml_equal(root, original_tree.getroot())
+                if made_backup and unchanged:
+                    os.remove(bak_path)
+                    logging.debug("%s is unchanged; no backup kept.", file)
 
-                success = builder._create_xpm(
-                    program_name=program_name,
-                    sample_files=[],  # Pass empty list as we are using mappings
-                    output_folder=root_dir,
-                    mode="multi-sample",  # This mode is best for handling mappings
-                    mappings=mappings,
-                    instrument_template=instrument_template,
+                return True
+            else:
+                logging.error(
+                    f"Failed to rebuild {file}. Original restored from .bak if possible."
                 )
+                if os.path.exists(bak_path):
+                    _move_file(bak_path, path)  # Restore on failure
+                    _forget_xpm_tree(path)
+                return False
 
-                if success:
-                    # Post-rebuild modifications if needed (Mod Matrix, etc.)
-                    tree = ET.parse(path)
-                    root = tree.getroot()
-                    post_change = False
-                    if matrix and apply_mod_matrix(root, matrix):
-                        post_change = True
-                    if params.get("fix_notes") and fix_sample_notes(
-                        root, os.path.dirname(path)
-                    ):
-                        post_change = True
-                    if fix_master_transpose(root, os.path.dirname(path)):
-                        post_change = True
-                    if "keytrack" in params and set_layer_keytrack(
-                        root, params["keytrack"]
-                    ):
-                        post_change = True
+        except Exception as exc:
+            # The cached tree may have been left half-edited
+            _forget_xpm_tree(path)
+            logging.error(
+                f"Failed to process and rebuild {path}: {exc}\n{traceback.format_exc()}"
+            )
+            return False
 
-                    if post_change:
-                        indent_tree(tree)
-                        tree.write(path, encoding="utf-8", xml_declaration=True)
 
-                    edited += 1
-                else:
-                    logging.error(
-                        f"Failed to rebuild {file}. Original restored from .bak if possible."
-                    )
-                    if os.path.exists(bak_path):
-                        shutil.move(bak_path, path)  # Restore on failure
+    def rebuild_folder(paths):
+        return sum(1 for path in paths if rebuild_one(path))
 
-            except Exception as exc:
-                logging.error(
-                    f"Failed to process and rebuild {path}: {exc}\n{traceback.format_exc()}"
-                )
+    # Collect the list up front: rebuilt programs may be written under a new
+    # name and must not be picked up again while the walk is in progress.
+    if xpms is None:
+        xpms = _iter_xpms(folder_path)
+    by_folder = defaultdict(list)
+    for path in xpms:
+        by_folder[os.path.dirname(path)].append(path)
 
+    # Programs are independent and mostly wait on disk, so folders are
+    # rebuilt in parallel. Programs in one folder stay sequential because
+    # two of them can share a ProgramName and so the same output file.
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        futures = [
+            executor.submit(rebuild_folder, paths) for paths in by_folder.values()
+        ]
+        for future in concurrent.futures.as_completed(futures):
+            edited += future.result()
+
+    logging.info(f"Rebuilt {edited} programs in {len(by_folder)} folders.")
     return edited
 
 
+def _install_fatal_log():
+    """Write exceptions nothing caught, in any thread, to ``FATAL_LOG_FILE``.
+
+    Routine ``logging.error`` records stay out of it; the records also reach
+    converter.log and the log view through the root logger.
+    """
+    # Written directly rather than through the log queue so a crash is on
+    # disk before the process exits.
+    handler = logging.handlers.RotatingFileHandler(
+        FATAL_LOG_FILE,
+        maxBytes=FATAL_LOG_MAX_BYTES,
+        backupCount=FATAL_LOG_BACKUP_COUNT,
+        encoding="utf-8",
+        delay=True,
+    )
+    handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+    )
+    _FATAL_LOGGER.addHandler(handler)
+
+    previous_excepthook = sys.excepthook
+    previous_thread_excepthook = threading.excepthook
+
+    def excepthook(exc_type, exc_value, exc_traceback):
+        if not issubclass(exc_type, KeyboardInterrupt):
+            _FATAL_LOGGER.critical(
+                "Unhandled exception",
+                exc_info=(exc_type, exc_value, exc_traceback),
+            )
+        previous_excepthook(exc_type, exc_value, exc_traceback)
+
+    def thread_excepthook(args):
+        if not issubclass(args.exc_type, SystemExit):
+            name = args.thread.name if args.thread is not None else "unknown"
+            _FATAL_LOGGER.critical(
+                f"Unhandled exception in thread {name}",
+                exc_info=(args.exc_type, args.exc_value, args.exc_traceback),
+            )
+        previous_thread_excepthook(args)
+
+    sys.excepthook = excepthook
+    threading.excepthook = thread_excepthook
+
+
 def main():
     if sys.platform == "darwin" and sys.version_info[:2] >= (3, 13):
         print(
@@ -4913,14 +5874,15 @@ def main():
             )
             sys.exit(1)
 
+    # basicConfig() is a no-op once the app has attached its own handlers, so
+    # the fatal log gets a dedicated handler up front instead of at crash time.
+    _install_fatal_log()
+
     try:
         app = App()
         app.mainloop()
     except Exception as e:
-        logging.basicConfig(filename="fatal_error.log", level=logging.ERROR)
-        logging.error(
-            f"A fatal, unhandled error occurred: {e}\n{traceback.format_exc()}"
-        )
+        _FATAL_LOGGER.critical(f"A fatal, unhandled error occurred: {e}", exc_info=True)
         try:
             root = tk.Tk()
             root.withdraw()
@@ -4933,4 +5895,7 @@ def main():
 
 
 if __name__ == "__main__":
+    # Frozen Windows builds would otherwise start the GUI again in every
+    # audio_pitch pool worker
+    multiprocessing.freeze_support()
     main()
@@ -15,16 +15,33 @@ NOTE: Requires the following libraries:
 
 from __future__ import annotations
 
+import atexit
+import concurrent.futures
+import functools
+import json
 import logging
+import multiprocessing
 import os
+import threading
+from concurrent.futures.process import BrokenProcessPool
 from math import log2
 from typing import Optional, List, Dict, Tuple
 from dataclasses import dataclass
-from statistics import mode, median_high
 
 import numpy as np
 import soundfile as sf
 
+ANALYSIS_SR = 22050  # files are resampled to this; C7 is far below Nyquist
+ANALYSIS_MAX_SECONDS = 5.0  # only the start of longer files is decoded
+PITCH_CACHE_SIZE = 4096  # detection results kept per (path, mtime, size)
+# Results also persist across runs in one JSON file, one entry per sample path
+PITCH_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".xpm_pitch_cache.json")
+PITCH_CACHE_FILE_ENTRIES = 100_000  # oldest entries are dropped beyond this
+C7_HZ = 440.0 * 2 ** ((96 - 69) / 12)  # librosa.note_to_hz('C7'), pYIN's fmax
+STFT_N_FFT = 2048  # shared STFT size; librosa's default
+STFT_HOP = 512  # hop of the shared STFT, CQT and onset frames
+PITCH_WORKERS = os.cpu_count() or 1  # processes of the batch detection pool
+
 # Data structure for pitch detection results
 @dataclass
 class PitchResult:
@@ -61,32 +78,247 @@ def detect_fundamental_pitch(path: str) -> Optional[int]:
     5. Chroma feature analysis
     6. Constant-Q transform analysis
     
+    Results are cached per path while the file's mtime and size are
+    unchanged, both in memory and in ``PITCH_CACHE_FILE``, so analysing the
+    same sample again, in this run or a later one, is free.
+    
     Returns:
         Optional[int]: MIDI note number (0-127) or None if detection fails
     """
     if not LIBROSA_AVAILABLE:
         return None
-        
+    try:
+        st = os.stat(path)
+    except OSError:
+        return _detect_fundamental_pitch(path)
+    return _cached_fundamental_pitch(path, st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=PITCH_CACHE_SIZE)
+def _cached_fundamental_pitch(path: str, mtime_ns: int, size: int) -> Optional[int]:
+    abs_path = os.path.abspath(path)
+    if (abs_path, mtime_ns, size) in _PITCH_FAILURES:
+        return None
+    midi_note = _stored_pitch(abs_path, mtime_ns, size)
+    if midi_note is None:
+        midi_note = _detect_fundamental_pitch(path)
+        if midi_note is not None:
+            _store_pitch(abs_path, mtime_ns, size, midi_note)
+    return midi_note
+
+
+_PITCH_STORE: Optional[Dict[str, list]] = None  # abs path -> [mtime_ns, size, note]
+_PITCH_STORE_NEW: Dict[str, list] = {}  # entries to write back at exit
+_PITCH_STORE_LOCK = threading.Lock()
+# (abs path, mtime_ns, size) the batch pool found no pitch in; this run only
+_PITCH_FAILURES: set = set()
+_PITCH_POOL: Optional[concurrent.futures.ProcessPoolExecutor] = None
+_PITCH_POOL_LOCK = threading.Lock()
+
+
+def _read_pitch_cache_file() -> Dict[str, list]:
+    try:
+        with open(PITCH_CACHE_FILE, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _stored_pitch(abs_path: str, mtime_ns: int, size: int) -> Optional[int]:
+    """Return the note saved for this version of ``abs_path``, if any."""
+    global _PITCH_STORE
+    with _PITCH_STORE_LOCK:
+        if _PITCH_STORE is None:
+            _PITCH_STORE = _read_pitch_cache_file()
+        entry = _PITCH_STORE.get(abs_path)
+    if isinstance(entry, list) and len(entry) == 3 and entry[:2] == [mtime_ns, size]:
+        return entry[2]
+    return None
+
+
+def _store_pitch(abs_path: str, mtime_ns: int, size: int, midi_note: int) -> None:
+    global _PITCH_STORE
+    entry = [mtime_ns, size, int(midi_note)]
+    with _PITCH_STORE_LOCK:
+        if _PITCH_STORE is None:
+            _PITCH_STORE = _read_pitch_cache_file()
+        if not _PITCH_STORE_NEW:
+            atexit.register(_save_pitch_cache)
+        _PITCH_STORE[abs_path] = entry
+        _PITCH_STORE_NEW[abs_path] = entry
+
+
+def _save_pitch_cache() -> None:
+    """Merge this run's results into ``PITCH_CACHE_FILE``.
+
+    The file is re-read first so entries written by other processes in the
+    meantime are kept, and replaced atomically so readers never see a
+    partial file.
+    """
+    with _PITCH_STORE_LOCK:
+        if not _PITCH_STORE_NEW:
+            return
+        data = _read_pitch_cache_file()
+        for abs_path, entry in _PITCH_STORE_NEW.items():
+            data.pop(abs_path, None)  # re-insert so the newest entries are last
+            data[abs_path] = entry
+        _PITCH_STORE_NEW.clear()
+    if len(data) > PITCH_CACHE_FILE_ENTRIES:
+        data = dict(list(data.items())[-PITCH_CACHE_FILE_ENTRIES:])
+    tmp_path = f"{PITCH_CACHE_FILE}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp_path, PITCH_CACHE_FILE)
+    except OSError as e:
+        logging.warning(f"Could not save pitch cache {PITCH_CACHE_FILE}: {e}")
+
+
+def _limit_worker_threads() -> None:
+    """Keep each pool worker's BLAS/OpenMP libraries to one thread.
+
+    numpy is already imported when a worker starts, so setting
+    ``OMP_NUM_THREADS`` there would come too late; threadpoolctl (installed
+    with librosa's scikit-learn dependency) changes the live pools instead.
+    """
+    try:
+        from threadpoolctl import threadpool_limits
+    except ImportError:
+        return
+    threadpool_limits(1)
+
+
+def _pitch_pool() -> concurrent.futures.ProcessPoolExecutor:
+    """Return the process pool shared by every batch detection.
+
+    The pool is started on first use and kept for the rest of the run, so
+    its workers import librosa, and under spawn the calling script, once.
+    Workers are spawned rather than forked because the GUI calling this
+    already runs threads of its own.
+    """
+    global _PITCH_POOL
+    with _PITCH_POOL_LOCK:
+        if _PITCH_POOL is None:
+            _PITCH_POOL = concurrent.futures.ProcessPoolExecutor(
+                max_workers=PITCH_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_limit_worker_threads,
+            )
+        return _PITCH_POOL
+
+
+def _discard_pitch_pool(pool: concurrent.futures.ProcessPoolExecutor) -> None:
+    """Drop ``pool`` after a worker died so the next batch starts a new one."""
+    global _PITCH_POOL
+    with _PITCH_POOL_LOCK:
+        if _PITCH_POOL is pool:
+            _PITCH_POOL = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def detect_fundamental_pitch_batch(paths: List[str]) -> List[Optional[int]]:
+    """Return ``detect_fundamental_pitch`` for each of ``paths``, in order.
+
+    Detection is CPU bound and holds the GIL for much of its time, so the
+    files are analysed in a process pool of ``PITCH_WORKERS``. Samples
+    already in the pitch cache are answered without going to the pool, and
+    the pool's results are cached here, so ``detect_fundamental_pitch`` on
+    the same files afterwards does not analyse them again. Missing files
+    and files the pool fails on are logged and get ``None``.
+    """
+    if len(paths) < 2 or not LIBROSA_AVAILABLE:
+        return [detect_fundamental_pitch(path) for path in paths]
+
+    results: List[Optional[int]] = [None] * len(paths)
+    pending = []  # (index, cache key)
+    for i, path in enumerate(paths):
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+        results[i] = _stored_pitch(*key)
+        if results[i] is None:
+            pending.append((i, key))
+    if len(pending) < 2:
+        for i, _key in pending:
+            results[i] = detect_fundamental_pitch(paths[i])
+        return results
+
+    pool = _pitch_pool()
+    futures = [pool.submit(detect_fundamental_pitch, paths[i]) for i, _ in pending]
+    for (i, key), future in zip(pending, futures):
+        try:
+            midi_note = future.result()
+        except BrokenProcessPool as e:
+            # Every file still queued fails with this, not just the one that
+            # killed its worker, so none of them is marked as failed.
+            logging.error(f"Pitch detection pool stopped at {paths[i]}: {e}")
+            _discard_pitch_pool(pool)
+            continue
+        except Exception as e:
+            logging.error(f"Pitch detection failed for {paths[i]}: {e}")
+            midi_note = None
+        results[i] = midi_note
+        # Workers exit without running atexit hooks, so their results are
+        # saved from here
+        if midi_note is None:
+            _PITCH_FAILURES.add(key)
+        else:
+            _store_pitch(*key, midi_note)
+    return results
+
+
+@functools.lru_cache(maxsize=8)
+def _fft_frequencies(sr: int, n_fft: int) -> np.ndarray:
+    """Return ``librosa.fft_frequencies`` for ``sr``, shared between calls.
+
+    Every file is analysed at ``ANALYSIS_SR``, so this is one array for
+    the whole run. Callers must not modify it.
+    """
+    freqs = librosa.fft_frequencies(sr=sr, n_fft=n_fft)
+    freqs.flags.writeable = False
+    return freqs
+
+
+def _detect_fundamental_pitch(path: str) -> Optional[int]:
+    """Run every detector on ``path`` and return their weighted consensus."""
     results: List[PitchResult] = []
     
     try:
-        # Load audio file
-        y, sr = librosa.load(path, sr=None, mono=True)
+        # Load audio file. Pitches up to C7 (~2.1 kHz) need nowhere near the
+        # file's own rate, and every stage below scales with the sample count.
+        # The pitch of a sample is established within its first seconds, so
+        # long loops and pads are not decoded in full.
+        y, sr = librosa.load(
+            path,
+            sr=ANALYSIS_SR,
+            mono=True,
+            duration=ANALYSIS_MAX_SECONDS,
+            dtype=np.float32,  # keeps the STFT and CQT in single precision
+        )
         
         if y.size == 0:
             logging.warning("Audio file is empty: %s", path)
             return None
 
+        # One magnitude STFT is shared by the harmonic, centroid and onset
+        # stages instead of each stage transforming the signal again.
+        S = np.abs(librosa.stft(y, n_fft=STFT_N_FFT, hop_length=STFT_HOP))
+        freqs = _fft_frequencies(sr, STFT_N_FFT)
+
         # 1. pYIN algorithm
         try:
-            # Increased frame_length to 4096 and adjusted fmin to 43.066 Hz (slightly higher than C1)
-            # This addresses the warning about inaccurate pitch detection due to insufficient periods
+            # fmin is 43.066 Hz (slightly higher than C1) and frames are ~93 ms
+            # long, which avoids the warning about inaccurate pitch detection
+            # due to insufficient periods
             f0, voiced_flag, voiced_prob = librosa.pyin(
                 y,
                 fmin=43.066,  # Slightly higher than C1 (32.7 Hz) to ensure accurate detection
-                fmax=librosa.note_to_hz('C7'),
+                fmax=C7_HZ,
                 sr=sr,
-                frame_length=4096  # Increased from default 2048 to allow for more periods of low frequencies
+                frame_length=2048  # At ANALYSIS_SR this spans as long as 4096 did at 44.1 kHz
             )
             
             voiced_f0 = f0[voiced_flag]
@@ -95,24 +327,21 @@ def detect_fundamental_pitch(path: str) -> Optional[int]:
             if voiced_f0.size > 0:
                 # Use weighted histogram to find the most stable pitch
                 hist, bins = np.histogram(voiced_f0, bins=100, weights=voiced_probs)
-                bin_centers = (bins[:-1] + bins[1:]) / 2
-                stable_pitch_hz = bin_centers[np.argmax(hist)]
+                peak = int(hist.argmax())
+                stable_pitch_hz = (bins[peak] + bins[peak + 1]) / 2
                 
                 midi_note = int(round(librosa.hz_to_midi(stable_pitch_hz)))
                 if 0 <= midi_note <= 127:
                     # Calculate confidence based on peak prominence and probability
-                    peak_height = np.max(hist)
-                    total_height = np.sum(hist)
-                    confidence = float(np.mean(voiced_probs) * (peak_height / total_height))
+                    peak_height = hist[peak]
+                    total_height = hist.sum()
+                    confidence = float(voiced_probs.mean() * (peak_height / total_height))
                     results.append(PitchResult(midi_note, confidence, 'pyin'))
         except Exception as e:
             logging.warning(f"pYIN detection failed: {e}")
 
         # 2. Harmonic Structure Analysis
         try:
-            S = np.abs(librosa.stft(y))
-            freqs = librosa.fft_frequencies(sr=sr)
-            
             # Find peaks in the magnitude spectrum
             peaks = librosa.util.peak_pick(np.mean(S, axis=1), 3, 3, 3, 5, 0.5, 0.5)
             peak_freqs = freqs[peaks]
@@ -134,22 +363,23 @@ def detect_fundamental_pitch(path: str) -> Optional[int]:
         # 3. Chroma Feature Analysis
         try:
             # Compute chromagram using CQT
-            C = np.abs(librosa.cqt(y, sr=sr, hop_length=512, fmin=43.066))
+            C = np.abs(librosa.cqt(y, sr=sr, hop_length=STFT_HOP, fmin=43.066))
             chroma = librosa.feature.chroma_cqt(C=C, sr=sr)
             
             # Find the strongest pitch class
-            pitch_class = np.argmax(np.mean(chroma, axis=1))
+            chroma_mean = chroma.mean(axis=1)
+            pitch_class = int(chroma_mean.argmax())
             
             # Estimate octave using spectral centroid
-            cent = librosa.feature.spectral_centroid(y=y, sr=sr)
-            octave = int(np.log2(np.mean(cent) / 440.0) + 4)
+            cent = librosa.feature.spectral_centroid(S=S, sr=sr, freq=freqs)
+            octave = int(log2(float(cent.mean()) / 440.0) + 4)
             
             # Combine pitch class and octave
             midi_note = pitch_class + (octave + 1) * 12
             if 0 <= midi_note <= 127:
                 # Confidence based on how dominant the pitch class is
-                max_magnitude = np.max(np.mean(chroma, axis=1))
-                mean_magnitude = np.mean(np.mean(chroma, axis=1))
+                max_magnitude = float(chroma_mean.max())
+                mean_magnitude = float(chroma_mean.mean())
                 confidence = (max_magnitude - mean_magnitude) / max_magnitude
                 results.append(PitchResult(midi_note, float(confidence), 'chroma'))
         except Exception as e:
@@ -161,34 +391,35 @@ def detect_fundamental_pitch(path: str) -> Optional[int]:
             onset_env = librosa.onset.onset_strength(y=y, sr=sr)
             onset_frames = librosa.onset.onset_detect(onset_envelope=onset_env, sr=sr)
             
-            if len(onset_frames) > 0:
-                # Analyze pitch in the stable part of each onset
-                onset_pitches = []
-                onset_confidences = []
-                
-                for start, end in zip(onset_frames[:-1], onset_frames[1:]):
-                    # Get the segment after attack
-                    segment_start = start + (end - start) // 4  # Skip initial attack
-                    segment = y[segment_start * 512:end * 512]
-                    
-                    if len(segment) > 512:  # Ensure segment is long enough
-                        # Use STFT for frequency analysis
-                        S_segment = np.abs(librosa.stft(segment))
-                        freqs = librosa.fft_frequencies(sr=sr)
-                        peak_idx = np.argmax(np.mean(S_segment, axis=1))
-                        freq = freqs[peak_idx]
-                        
-                        midi_note = int(round(librosa.hz_to_midi(freq)))
-                        if 0 <= midi_note <= 127:
-                            # Confidence based on peak prominence
-                            prominence = np.mean(S_segment, axis=1)[peak_idx] / np.mean(S_segment)
-                            onset_pitches.append(midi_note)
-                            onset_confidences.append(prominence)
+            if len(onset_frames) > 1:
+                # Analyze pitch in the stable part of each onset: the segment
+                # runs to the next onset, skipping a quarter as the attack.
+                starts = onset_frames[:-1] + (onset_frames[1:] - onset_frames[:-1]) // 4
+                ends = onset_frames[1:]
+                segment_lens = np.minimum(ends * STFT_HOP, y.size) - starts * STFT_HOP
+                keep = segment_lens > STFT_HOP  # Ensure segment is long enough
+                starts = starts[keep]
+                ends = np.minimum(ends[keep] + 1, S.shape[1])
+
+                # Mean spectrum of every segment from one running sum over the
+                # shared STFT's frames, instead of a slice and mean per onset
+                cum = np.zeros((S.shape[0], S.shape[1] + 1))
+                np.cumsum(S, axis=1, out=cum[:, 1:])
+                segment_means = (cum[:, ends] - cum[:, starts]) / (ends - starts)
+                peak_idx = np.argmax(segment_means, axis=0)
+                with np.errstate(divide='ignore'):  # a peak in the 0 Hz bin
+                    midi_notes = np.round(librosa.hz_to_midi(freqs[peak_idx]))
+                # Confidence based on peak prominence
+                prominence = segment_means.max(axis=0) / segment_means.mean(axis=0)
+
+                valid = (midi_notes >= 0) & (midi_notes <= 127)
+                onset_pitches = midi_notes[valid].astype(int)
+                onset_confidences = prominence[valid]
                 
-                if onset_pitches:
+                if onset_pitches.size:
                     # Use most common pitch from onset analysis
-                    midi_note = mode(onset_pitches)
-                    confidence = np.mean([c for p, c in zip(onset_pitches, onset_confidences) if p == midi_note])
+                    midi_note = int(np.bincount(onset_pitches).argmax())
+                    confidence = onset_confidences[onset_pitches == midi_note].mean()
                     results.append(PitchResult(midi_note, float(confidence), 'onset'))
         except Exception as e:
             logging.warning(f"Onset analysis failed: {e}")
@@ -1,9 +1,13 @@
+import concurrent.futures
 import os
 import zipfile
 import argparse
 import logging
 import traceback
 
+# Audio barely shrinks under deflate, so it is stored as-is
+STORED_EXTENSIONS = ('.wav', '.aif', '.aiff', '.flac', '.ogg', '.mp3')
+
 
 def package_expansion(folder: str, output_zip: str):
     """Create a ZIP archive from the given expansion folder."""
@@ -21,21 +25,35 @@ def package_expansion(folder: str, output_zip: str):
                 if os.path.abspath(file_path) == os.path.abspath(output_zip):
                     continue
                 arcname = os.path.relpath(file_path, os.path.dirname(folder))
-                zipf.write(file_path, arcname)
+                if file.lower().endswith(STORED_EXTENSIONS):
+                    zipf.write(file_path, arcname, compress_type=zipfile.ZIP_STORED)
+                else:
+                    zipf.write(file_path, arcname)
 
 
 def package_all_expansions(root_folder: str, output_folder: str):
     """Package each subfolder in root_folder as a separate expansion."""
     os.makedirs(output_folder, exist_ok=True)
+    jobs = {}
     for name in os.listdir(root_folder):
         folder_path = os.path.join(root_folder, name)
         if not os.path.isdir(folder_path):
             continue
-        output_zip = os.path.join(output_folder, f"{name}.zip")
-        try:
-            package_expansion(folder_path, output_zip)
-        except Exception as exc:
-            logging.error("Failed to package %s: %s\n%s", name, exc, traceback.format_exc())
+        jobs[name] = (folder_path, os.path.join(output_folder, f"{name}.zip"))
+
+    # Each expansion is its own archive, and deflate and file I/O release
+    # the GIL, so the folders are packaged in parallel threads.
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        futures = {
+            executor.submit(package_expansion, *job): name
+            for name, job in jobs.items()
+        }
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                future.result()
+            except Exception as exc:
+                name = futures[future]
+                logging.error("Failed to package %s: %s\n%s", name, exc, traceback.format_exc())
 
 
 def main():
@@ -203,7 +203,8 @@ def edit_program(
             changed = True
 
     if changed:
-        indent_tree(tree)
+        # Not re-indented: the MPC does not need it, and in a folder-wide
+        # edit it would cost a full tree walk per program.
         tree.write(file_path, encoding='utf-8', xml_declaration=True)
         logging.info("Updated %s", file_path)
 
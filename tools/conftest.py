@@ -0,0 +1,21 @@
+"""Shared fixtures for the tools tests."""
+
+import importlib.util
+import os
+import sys
+
+import pytest
+
+PARENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PARENT_DIR not in sys.path:
+    sys.path.insert(0, PARENT_DIR)
+
+
+@pytest.fixture(scope="session")
+def converter():
+    """The main converter script, imported as a module."""
+    path = os.path.join(PARENT_DIR, "Gemini wav_TO_XpmV2.py")
+    spec = importlib.util.spec_from_file_location("gemini_wav_to_xpm", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
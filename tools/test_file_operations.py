@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Tests for the converter's folder walking, merging and moving helpers."""
+
+import errno
+import os
+
+import pytest
+
+
+def _touch(path, data=b""):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def _relative(root, paths):
+    return sorted(os.path.relpath(p, root).replace(os.sep, "/") for p in paths)
+
+
+def test_walker_skips_hidden_files_and_folders(converter, tmp_path):
+    for rel in (
+        "Kick.wav",
+        "sub/Snare.WAV",
+        ".DS_Store",
+        "._Kick.wav",
+        "sub/._Snare.WAV",
+        ".Trashes/501/Old.wav",
+    ):
+        _touch(os.path.join(tmp_path, rel))
+    root = str(tmp_path)
+
+    visible = [entry.path for entry in converter._iter_file_entries(root)]
+    assert _relative(root, visible) == ["Kick.wav", "sub/Snare.WAV"]
+    assert _relative(root, converter._iter_ext(root, ".wav")) == [
+        "Kick.wav",
+        "sub/Snare.WAV",
+    ]
+
+    everything = converter._iter_file_entries(root, include_hidden=True)
+    assert len(_relative(root, [entry.path for entry in everything])) == 6
+
+
+def test_merge_renames_nested_case_insensitive_collisions(converter, tmp_path):
+    _touch(os.path.join(tmp_path, "Kick.wav"), b"root")
+    _touch(os.path.join(tmp_path, "sub", "kick.wav"), b"sub")
+    _touch(os.path.join(tmp_path, "sub", "deep", "KICK.wav"), b"deep")
+
+    assert converter.merge_subfolders_to_root(str(tmp_path)) == 2
+
+    assert sorted(os.listdir(tmp_path)) == ["Kick.wav", "deep_KICK.wav", "sub_kick.wav"]
+    for name, data in (
+        ("Kick.wav", b"root"),
+        ("sub_kick.wav", b"sub"),
+        ("deep_KICK.wav", b"deep"),
+    ):
+        with open(os.path.join(tmp_path, name), "rb") as f:
+            assert f.read() == data
+
+
+def test_move_falls_back_to_shutil_across_devices(converter, tmp_path, monkeypatch):
+    src = os.path.join(tmp_path, "a", "Kick.wav")
+    dst = os.path.join(tmp_path, "b", "Kick.wav")
+    _touch(src, b"data")
+    os.makedirs(os.path.dirname(dst))
+
+    def cross_device_replace(src, dst):
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    monkeypatch.setattr(converter.os, "replace", cross_device_replace)
+    converter._move_file(src, dst)
+
+    assert not os.path.exists(src)
+    with open(dst, "rb") as f:
+        assert f.read() == b"data"
+
+
+def test_move_raises_other_errors(converter, tmp_path, monkeypatch):
+    src = os.path.join(tmp_path, "Kick.wav")
+    _touch(src)
+
+    def denied_replace(src, dst):
+        raise OSError(errno.EACCES, "Permission denied")
+
+    monkeypatch.setattr(converter.os, "replace", denied_replace)
+    with pytest.raises(OSError):
+        converter._move_file(src, os.path.join(tmp_path, "Moved.wav"))
+    assert os.path.exists(src)
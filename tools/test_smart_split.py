@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""Tests for the converter's Smart Split "category" mode."""
+
+import os
+
+
+def _write_program(path, filler):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('<?xml version="1.0" encoding="utf-8"?>\n<MPCVObject>\n')
+        # ProgramPads JSON mentions "pad" right at the top of every program
+        f.write("  <ProgramPads-v2.10>{&quot;pads&quot;: {}}</ProgramPads-v2.10>\n")
+        f.write(filler)
+        f.write("  <Program><ProgramName>Grand Piano</ProgramName></Program>\n")
+        f.write("</MPCVObject>\n")
+
+
+def test_category_uses_higher_ranked_tag_after_head(converter, tmp_path):
+    filler = "  <!--" + "x" * converter.CATEGORY_HEAD_CHARS + "-->\n"
+    _write_program(tmp_path / "Program1.xpm", filler)
+
+    assert converter.split_files_smartly(str(tmp_path), {"mode": "category"}) == 1
+    assert os.path.exists(tmp_path / "piano" / "Program1.xpm")
+
+
+def test_category_from_head_alone(converter, tmp_path):
+    _write_program(tmp_path / "Program1.xpm", "")
+
+    assert converter.split_files_smartly(str(tmp_path), {"mode": "category"}) == 1
+    assert os.path.exists(tmp_path / "piano" / "Program1.xpm")
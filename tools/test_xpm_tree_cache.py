@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""Tests for the converter's parsed-XPM cache."""
+
+import os
+
+PROGRAM = """<?xml version="1.0" encoding="utf-8"?>
+<MPCVObject>
+  <Program type="Keygroup">
+    <Instruments>
+      <Instrument number="0">
+        <VoiceOverlap>Poly</VoiceOverlap>
+      </Instrument>
+    </Instruments>
+  </Program>
+</MPCVObject>
+"""
+
+
+def test_cached_tree_not_reused_after_same_size_edit(converter, tmp_path):
+    path = str(tmp_path / "Keys.xpm")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(PROGRAM)
+    st = os.stat(path)
+    tree = converter._load_xpm_tree(path)
+    assert tree.getroot().find(".//VoiceOverlap").text == "Poly"
+
+    assert converter.quick_edit_set_mono(str(tmp_path), xpms=[path]) == 1
+    # Same size, and on FAT the same mtime: only the writer can tell the
+    # cache that the file changed.
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert os.path.getsize(path) == st.st_size
+
+    tree = converter._load_xpm_tree(path)
+    assert tree.getroot().find(".//VoiceOverlap").text == "Mono"
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Tests for the converter's text-based XPM lookups against full parses."""
+
+import json
+import logging
+import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape as xml_escape, unescape as xml_unescape
+
+import pytest
+
+
+def _pad(sample_path):
+    return {"samplePath": sample_path, "rootNote": 60, "lowNote": 0, "highNote": 127}
+
+
+def _write_program(path, pads_obj=None, instruments=1, declared=None, layers=()):
+    root = ET.Element("MPCVObject")
+    program = ET.SubElement(root, "Program", type="Keygroup")
+    if pads_obj is not None:
+        # Escaped once here and once more when the tree is written, like
+        # build_program_pads_json's output
+        ET.SubElement(program, "ProgramPads-v2.10").text = xml_escape(
+            json.dumps(pads_obj)
+        )
+    if declared is not None:
+        ET.SubElement(program, "KeygroupNumKeygroups").text = str(declared)
+    insts = ET.SubElement(program, "Instruments")
+    for i in range(instruments):
+        inst = ET.SubElement(insts, "Instrument", number=str(i))
+        layers_elem = ET.SubElement(inst, "Layers")
+        for name in layers if i == 0 else ():
+            layer = ET.SubElement(layers_elem, "Layer")
+            ET.SubElement(layer, "SampleName").text = name
+    ET.ElementTree(root).write(path, encoding="utf-8", xml_declaration=True)
+
+
+def _validate_by_dom(path, expected_samples):
+    """validate_xpm_file's ProgramPads checks, decoding the whole JSON."""
+    root = ET.parse(path).getroot()
+    actual = len(root.findall(".//Instruments/Instrument"))
+    data = json.loads(xml_unescape(root.find(".//ProgramPads-v2.10").text))
+    entries = [
+        v for v in data.get("pads", {}).values()
+        if isinstance(v, dict) and v.get("samplePath")
+    ]
+    mismatch = "padToInstrument" in data and len(data["padToInstrument"]) != actual
+    return not (expected_samples > 0 and not entries), mismatch
+
+
+EMPTY_PADS = {f"value{i}": 0 for i in range(128)}
+PADS_CASES = {
+    "mapped": ({"pads": {**EMPTY_PADS, "value60": _pad("Kick.wav")}}, 1),
+    "unmapped": ({"pads": EMPTY_PADS}, 1),
+    "unmapped, nothing expected": ({"pads": EMPTY_PADS}, 0),
+    "empty sample path": ({"pads": {**EMPTY_PADS, "value1": _pad("")}}, 1),
+    "quoted sample path": ({"pads": {"value0": _pad('a "b".wav')}}, 1),
+    "sample path outside pads": (
+        {"pads": EMPTY_PADS, "extra": {"value0": 1, "samplePath": "x.wav"}},
+        1,
+    ),
+    "pad to instrument ok": (
+        {"pads": {"value0": _pad("a.wav")}, "padToInstrument": {"0": 0, "1": 1}},
+        1,
+    ),
+    "pad to instrument short": (
+        {"pads": {"value0": _pad("a.wav")}, "padToInstrument": {"0": 0}},
+        1,
+    ),
+    "pad to instrument empty": ({"pads": {"value0": 0}, "padToInstrument": {}}, 0),
+}
+
+
+@pytest.mark.parametrize("case", sorted(PADS_CASES))
+def test_program_pads_checks_match_full_decode(converter, tmp_path, caplog, case):
+    pads_obj, expected_samples = PADS_CASES[case]
+    path = str(tmp_path / "Program.xpm")
+    _write_program(path, pads_obj, instruments=2, declared=2)
+    valid, mismatch = _validate_by_dom(path, expected_samples)
+
+    with caplog.at_level(logging.WARNING):
+        assert converter.validate_xpm_file(path, expected_samples) is valid
+    assert ("padToInstrument mapping mismatch" in caplog.text) is mismatch
+
+
+@pytest.mark.parametrize("char_ref", [False, True])
+def test_preview_sample_ignores_names_outside_layers(converter, tmp_path, char_ref):
+    path = str(tmp_path / "Program.xpm")
+    _write_program(path, {"pads": EMPTY_PADS}, layers=["Right"])
+    tree = ET.parse(path)
+    # A SampleName outside any layer, ahead of the real one
+    stray = ET.Element("SampleName")
+    stray.text = "Wrong"
+    tree.getroot().insert(0, stray)
+    tree.write(path, encoding="utf-8", xml_declaration=True)
+    if char_ref:
+        # Character references send the lookup down its iterparse path
+        with open(path, encoding="utf-8") as f:
+            text = f.read().replace("Right", "&#82;ight")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+    assert converter._find_preview_sample(path) == "Right.wav"
+
+
+def test_preview_sample_prefers_program_pads(converter, tmp_path):
+    path = str(tmp_path / "Program.xpm")
+    pads = {"pads": {**EMPTY_PADS, "value3": _pad("Samples/Pad One.wav")}}
+    _write_program(path, pads, layers=["Layer Name"])
+
+    assert converter._find_preview_sample(path) == "Samples/Pad One.wav"
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import logging
+import mmap
 import os
 import re
 import struct
@@ -15,6 +16,60 @@ from audio_pitch import detect_fundamental_pitch
 from collections import Counter
 
 
+_FLAT_MAP = {
+    "CB": "B",
+    "DB": "C#",
+    "EB": "D#",
+    "FB": "E",
+    "GB": "F#",
+    "AB": "G#",
+    "BB": "A#",
+}
+_NOTE_MAP = {
+    "C": 0,
+    "C#": 1,
+    "D": 2,
+    "D#": 3,
+    "E": 4,
+    "F": 5,
+    "F#": 6,
+    "G": 7,
+    "G#": 8,
+    "A": 9,
+    "A#": 10,
+    "B": 11,
+}
+
+# Patterns used by name_to_midi and infer_note_from_filename, compiled once
+# because both run for every sample during scans.
+_NOTE_NAME_RE = re.compile(r"^([A-G][#B]?)[-_]?(-?\d+)$")
+_MPC_NAME_RE = re.compile(r"\d+_0?(\d{2,3})_([A-Ga-g][#b]?-?\d+)$")
+_DASH_MIDI_RE = re.compile(r"-(\d{1,3})(?:\.|_|$)")
+_UNDERSCORE_MIDI_RE = re.compile(r"_(\d{1,3})(?:\.|_|$)")
+_C_MINUS_ONE_RE = re.compile(r"[Cc]-1\b")
+_SHARP_NOTE_RE = re.compile(r"([A-Ga-g])#(\d{1,2})", re.IGNORECASE)
+_NEGATIVE_OCTAVE_RE = re.compile(r"([A-Ga-g][#b]?)-(\d{1})", re.IGNORECASE)
+_STANDARD_NOTE_RE = re.compile(
+    r"(?<![A-Za-z])([A-Ga-g][#b]?-?\d{1,2})(?![A-Za-z0-9])", re.IGNORECASE
+)
+_UNDERSCORE_END_NOTE_RE = re.compile(r"_([A-Ga-g][#b]?\d{1,2})$", re.IGNORECASE)
+_END_NOTE_RE = re.compile(r"([A-Ga-g][#b]?\d{1,2})$", re.IGNORECASE)
+_MIDDLE_UNDERSCORE_NOTE_RE = re.compile(
+    r"_([A-Ga-g][#b]?\d{1,2})(?=_)", re.IGNORECASE
+)
+_EMBEDDED_NOTE_RE = re.compile(r"([A-Ga-g][#b]\d{1,2})", re.IGNORECASE)
+_F_SHARP_3_RE = re.compile(r"f#_3", re.IGNORECASE)
+_SEPARATED_NOTE_RE = re.compile(
+    r"([A-Ga-g][#b])[^0-9A-Za-z]+(\d{1})(?!\d)", re.IGNORECASE
+)
+_DASH_MIDI_END_RE = re.compile(r"-(\d{1,3})(?:\.|$)")
+_BARE_NUMBER_RE = re.compile(r"\b(\d{2,3})\b")
+
+# Little-endian RIFF fields, compiled once for the WAV smpl helpers
+_U32_LE = struct.Struct("<I")
+_SMPL_BODY = struct.Struct("<9I")
+
+
 def _update_text(elem: Optional[ET.Element], value: Optional[str]) -> bool:
     """Update ``elem.text`` if ``value`` differs.
 
@@ -185,18 +240,8 @@ def name_to_midi(note_name: str) -> Optional[int]:
     logging.debug(f"Processing note name: {note_name}")
     
     # Normalize flats: Cb -> B, Db -> C#, etc.
-    flat_map = {
-        "CB": "B",
-        "DB": "C#",
-        "EB": "D#",
-        "FB": "E",
-        "GB": "F#",
-        "AB": "G#",
-        "BB": "A#",
-    }
-    
     # Check if the note is a flat note first (before the octave)
-    for flat_note, equivalent in flat_map.items():
+    for flat_note, equivalent in _FLAT_MAP.items():
         if note_name.startswith(flat_note):
             # Adjust the octave for special cases: Cb4 -> B3
             if flat_note == "CB" and len(note_name) > 2:
@@ -212,22 +257,6 @@ def name_to_midi(note_name: str) -> Optional[int]:
                 note_name = equivalent + octave_part
                 logging.debug(f"Normalized flat note to {note_name}")
     
-    # Define note to MIDI mappings
-    note_map = {
-        "C": 0,
-        "C#": 1,
-        "D": 2,
-        "D#": 3,
-        "E": 4,
-        "F": 5,
-        "F#": 6,
-        "G": 7,
-        "G#": 8,
-        "A": 9,
-        "A#": 10,
-        "B": 11,
-    }
-
     # Special handling for negative octaves - this is a common pattern
     if "-1" in note_name:
         if note_name.startswith("C-1"):
@@ -235,19 +264,19 @@ def name_to_midi(note_name: str) -> Optional[int]:
             return 0
     
     # Extended pattern to capture various formats including more flexible spacing/separators
-    m = re.match(r"^([A-G][#B]?)[-_]?(-?\d+)$", note_name)
+    m = _NOTE_NAME_RE.match(note_name)
     if not m:
         return None
         
     note, octave_str = m.groups()
-    if note not in note_map:
+    if note not in _NOTE_MAP:
         return None
         
     try:
         octave = int(octave_str)
         # The MIDI note number formula: note_value + (octave + 1) * 12
         # This formula maps C-1 to 0, C0 to 12, C1 to 24, etc.
-        midi = note_map[note] + (octave + 1) * 12
+        midi = _NOTE_MAP[note] + (octave + 1) * 12
         
         # Log successful conversion
         logging.debug(f"Converted {note_name} to MIDI {midi} (octave: {octave})")
@@ -293,7 +322,7 @@ def infer_note_from_filename(filename: str) -> Optional[int]:
     # Special case for MPC-style naming pattern (like 1_021_a-1.wav)
     # For these files, we'll prioritize the embedded MIDI number with a +1 offset (matching XPM root)
     base = os.path.splitext(os.path.basename(filename))[0]
-    mpc_midi_pattern = re.match(r'\d+_0?(\d{2,3})_([A-Ga-g][#b]?-?\d+)$', base)
+    mpc_midi_pattern = _MPC_NAME_RE.match(base)
     if mpc_midi_pattern:
         midi_str, note_name = mpc_midi_pattern.groups()
         try:
@@ -319,7 +348,7 @@ def infer_note_from_filename(filename: str) -> Optional[int]:
     midi_in_filename = None
     
     # Pattern: -NN where NN is a MIDI number (e.g., sample-60.wav)
-    midi_dash_match = re.search(r'-(\d{1,3})(?:\.|_|$)', base)
+    midi_dash_match = _DASH_MIDI_RE.search(base)
     if midi_dash_match:
         try:
             midi_num = int(midi_dash_match.group(1))
@@ -330,7 +359,7 @@ def infer_note_from_filename(filename: str) -> Optional[int]:
             pass
     
     # Pattern: _NN where NN is a MIDI number (e.g., sample_60.wav)
-    midi_underscore_match = re.search(r'_(\d{1,3})(?:\.|_|$)', base)
+    midi_underscore_match = _UNDERSCORE_MIDI_RE.search(base)
     if midi_underscore_match:
         try:
             midi_num = int(midi_underscore_match.group(1))
@@ -341,46 +370,44 @@ def infer_note_from_filename(filename: str) -> Optional[int]:
             pass
     
     # Special case for C-1 (MIDI note 0)
-    if re.search(r'[Cc]-1\b', base) or "Strings-C-1" in base:
+    if _C_MINUS_ONE_RE.search(base) or "Strings-C-1" in base:
         logging.debug("Special pattern match for C-1 (MIDI 0)")
         return 0
         
     # Pattern 1: Specific pattern for files like "******f#3.wav"
     # This is our highest priority pattern for the specific case mentioned
-    specific_sharp_matches = re.findall(r"([A-Ga-g])#(\d{1,2})", base, re.IGNORECASE)
+    specific_sharp_matches = _SHARP_NOTE_RE.findall(base)
     specific_sharp_note_matches = [f"{note}#{octave}" for note, octave in specific_sharp_matches]
     
     # Pattern 2: Look for negative octave notes like "C-1"
-    negative_octave_matches = re.findall(r"([A-Ga-g][#b]?)-(\d{1})", base, re.IGNORECASE)
+    negative_octave_matches = _NEGATIVE_OCTAVE_RE.findall(base)
     negative_octave_note_matches = [f"{note}-{octave}" for note, octave in negative_octave_matches]
     
     # Pattern 3: Standard note patterns like A3, C#4, etc.
-    note_matches = re.findall(
-        r"(?<![A-Za-z])([A-Ga-g][#b]?-?\d{1,2})(?![A-Za-z0-9])", base, re.IGNORECASE
-    )
+    note_matches = _STANDARD_NOTE_RE.findall(base)
     
     # Pattern 4: Notes at the end after underscore: file_c2.wav, piano_D4.wav, sample_g#2.wav
-    underscore_matches = re.findall(r"_([A-Ga-g][#b]?\d{1,2})$", base, re.IGNORECASE)
+    underscore_matches = _UNDERSCORE_END_NOTE_RE.findall(base)
     
     # Pattern 5: Notes at the end with no separator: fileC3.wav, pianoD4.wav, sampleg#2.wav
-    end_note_matches = re.findall(r"([A-Ga-g][#b]?\d{1,2})$", base, re.IGNORECASE)
+    end_note_matches = _END_NOTE_RE.findall(base)
     
     # Pattern 6: Notes in the middle after underscore: file_c2_xxx, sample_g#2_stereo
-    middle_underscore_matches = re.findall(r"_([A-Ga-g][#b]?\d{1,2})(?=_)", base, re.IGNORECASE)
+    middle_underscore_matches = _MIDDLE_UNDERSCORE_NOTE_RE.findall(base)
     
     # Pattern 7: More aggressive search for note patterns anywhere in the filename
-    embedded_matches = re.findall(r"([A-Ga-g][#b]\d{1,2})", base, re.IGNORECASE)
+    embedded_matches = _EMBEDDED_NOTE_RE.findall(base)
     
     # Special handling for specific cases
     
     # Case: f#_3.wav - explicitly detect F#3
-    if re.search(r'f#_3', base, re.IGNORECASE):
+    if _F_SHARP_3_RE.search(base):
         logging.debug("Special case match for f#_3 -> F#3 (MIDI 54)")
         return 54
         
     # Pattern 8: Look for note and octave separated by characters
     # This catches cases where there might be characters between note and octave, like "f#_3", "f#-3"
-    separated_match = re.search(r"([A-Ga-g][#b])[^0-9A-Za-z]+(\d{1})(?!\d)", base, re.IGNORECASE)
+    separated_match = _SEPARATED_NOTE_RE.search(base)
     if separated_match:
         note, octave = separated_match.groups()
         note_with_octave = f"{note}{octave}"
@@ -413,7 +440,7 @@ def infer_note_from_filename(filename: str) -> Optional[int]:
     # Fall back to looking for MIDI numbers
     
     # First, check for exact pattern like "sample-60.wav"
-    midi_pattern_match = re.search(r"-(\d{1,3})(?:\.|$)", base)
+    midi_pattern_match = _DASH_MIDI_END_RE.search(base)
     if midi_pattern_match:
         try:
             num = int(midi_pattern_match.group(1))
@@ -424,7 +451,7 @@ def infer_note_from_filename(filename: str) -> Optional[int]:
             pass
     
     # Otherwise, look for any 2-3 digit number in the range 0-127
-    num_matches = re.findall(r"\b(\d{2,3})\b", base)
+    num_matches = _BARE_NUMBER_RE.findall(base)
     if num_matches:
         for num_str in num_matches:
             try:
@@ -448,14 +475,19 @@ def extract_root_note_from_wav(filepath: str) -> Optional[int]:
 
     try:
         with open(filepath, "rb") as f:
-            data = f.read()
-        idx = data.find(b"smpl")
-        if idx != -1 and idx + 36 <= len(data):
-            # The MIDI unity note is stored 20 bytes after the 'smpl' tag
-            # (after the 8-byte chunk header and three 32-bit fields).
-            note = struct.unpack("<I", data[idx + 20 : idx + 24])[0]
-            if 0 <= note <= 127:
-                return note
+            if os.fstat(f.fileno()).st_size == 0:
+                return None
+            # Map the file instead of reading it, so only the pages the
+            # search touches are loaded and nothing is copied.
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                idx = data.find(b"smpl")
+                if idx != -1 and idx + 36 <= len(data):
+                    # The MIDI unity note is stored 20 bytes after the 'smpl'
+                    # tag (after the 8-byte chunk header and three 32-bit
+                    # fields).
+                    note = _U32_LE.unpack_from(data, idx + 20)[0]
+                    if 0 <= note <= 127:
+                        return note
     except Exception as exc:
         logging.error("Could not extract root note from WAV %s: %s", filepath, exc)
 
@@ -473,21 +505,27 @@ def write_root_note_to_wav(path: str, midi_note: int) -> bool:
 
     try:
         with open(path, "r+b") as f:
-            data = f.read()
-            idx = data.find(b"smpl")
-            if idx != -1 and idx + 24 <= len(data):
+            size = os.fstat(f.fileno()).st_size
+            idx = -1
+            if size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    idx = data.find(b"smpl")
+            if idx != -1 and idx + 24 <= size:
                 f.seek(idx + 20)
-                f.write(struct.pack("<I", midi_note))
+                f.write(_U32_LE.pack(midi_note))
                 return True
 
             # create new chunk at end
-            if len(data) >= 8 and data[:4] == b"RIFF" and data[8:12] == b"WAVE":
-                riff_size = struct.unpack("<I", data[4:8])[0]
-                new_chunk = b"smpl" + struct.pack("<I", 36) + struct.pack(
-                    "<9I", 0, 0, 0, midi_note, 0, 0, 0, 0, 0
+            header = f.read(12)
+            if len(header) >= 8 and header[:4] == b"RIFF" and header[8:12] == b"WAVE":
+                riff_size = _U32_LE.unpack_from(header, 4)[0]
+                new_chunk = (
+                    b"smpl"
+                    + _U32_LE.pack(36)
+                    + _SMPL_BODY.pack(0, 0, 0, midi_note, 0, 0, 0, 0, 0)
                 )
                 f.seek(4)
-                f.write(struct.pack("<I", riff_size + len(new_chunk)))
+                f.write(_U32_LE.pack(riff_size + len(new_chunk)))
                 f.seek(0, os.SEEK_END)
                 f.write(new_chunk)
                 return True
@@ -75,15 +75,19 @@ def calculate_key_ranges(mappings):
     return sorted_maps
 
 
-def _parse_xpm_for_rebuild(xpm_path):
-    """Return sample mappings and base parameters parsed from ``xpm_path``."""
+def _parse_xpm_for_rebuild(xpm_path, tree=None):
+    """Return sample mappings and base parameters parsed from ``xpm_path``.
+
+    Pass ``tree`` if the caller already parsed the file; it is only read.
+    """
     mappings = []
     instrument_params = {}
     xpm_path = os.path.abspath(xpm_path)
     xpm_dir = os.path.dirname(xpm_path)
 
     try:
-        tree = ET.parse(xpm_path)
+        if tree is None:
+            tree = ET.parse(xpm_path)
         root = tree.getroot()
     except ET.ParseError as e:
         logging.error(f"Could not parse XPM for rebuild: {xpm_path}. Error: {e}")